@@ -6,21 +6,22 @@ Helps users configure the project and test their Real-Debrid API key
 
 import os
 import json
-import asyncio
-import aiohttp
+import urllib.error
+import urllib.request
 from pathlib import Path
 
-async def test_api_key(api_key):
+def test_api_key(api_key):
     """Test Real-Debrid API key"""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {api_key}"}
-            async with session.get("https://api.real-debrid.com/rest/1.0/user", headers=headers) as response:
-                if response.status == 200:
-                    user_data = await response.json()
-                    return True, user_data
-                else:
-                    return False, f"HTTP {response.status}"
+        request = urllib.request.Request(
+            "https://api.real-debrid.com/rest/1.0/user",
+            headers={"Authorization": f"Bearer {api_key}"}
+        )
+        with urllib.request.urlopen(request, timeout=15) as response:
+            user_data = json.load(response)
+            return True, user_data
+    except urllib.error.HTTPError as e:
+        return False, f"HTTP {e.code}"
     except Exception as e:
         return False, str(e)
 
@@ -52,7 +53,7 @@ def setup_environment():
     
     return True
 
-async def main():
+def main():
     """Main setup function"""
     if not setup_environment():
         return
@@ -65,7 +66,7 @@ async def main():
         return
     
     print("\n🔍 Testing API key...")
-    success, result = await test_api_key(api_key)
+    success, result = test_api_key(api_key)
     
     if success:
         print(f"✅ API key valid!")
@@ -88,4 +89,4 @@ async def main():
         print("Please check your API key and try again")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
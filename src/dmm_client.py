@@ -5,54 +5,287 @@ Handles interaction with DMM hash lists for automated content discovery
 
 import aiohttp
 import asyncio
+import hashlib
 import logging
+import os
+import time
 from typing import List, Dict, Optional
 from pathlib import Path
 import json
 import re
 import base64
+import urllib.parse
 import zlib
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of hashes taken from a single GitHub hash list file
+_GITHUB_HASH_LIMIT = 1000
+
+# Precompiled patterns used on decoded (str) hash list data
+_HEX40_RE = re.compile(r'\b[a-fA-F0-9]{40}\b')
+# SHA-1 or SHA-256 hex digest in a single scan: 40 hex chars, optionally 24 more
+_HASH_RE = re.compile(r'\b[a-fA-F0-9]{40}(?:[a-fA-F0-9]{24})?\b')
+_HEX_ONLY_RE = re.compile(r'^[a-fA-F0-9]+$')
+_NON_WORD_RE = re.compile(r'[^\w]')
+_IFRAME_HASH_RE = re.compile(r'#([A-Za-z0-9+/=\-_]+)')
+# Keys that hold the info hash in JSON hash list entries, in order of preference
+_JSON_HASH_KEYS = ('hash', 'btih', 'info_hash')
+
+# Precompiled patterns used on raw (bytes) HTTP bodies, so pages are never decoded as a whole
+_HEX40_BYTES_RE = re.compile(rb'\b[a-fA-F0-9]{40}\b')
+_HASH_BYTES_RE = re.compile(rb'\b[a-fA-F0-9]{40}(?:[a-fA-F0-9]{24})?\b')
+_UUID_HTML_RE = re.compile(rb'([a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12})\.html')
+_IFRAME_RE = re.compile(rb'<iframe[^>]*src="([^"]*)"[^>]*>', re.IGNORECASE)
+_SCRIPT_RE = re.compile(rb'<script[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+# Embedded data assignments, searched for inside script bodies only
+_SCRIPT_DATA_RES = tuple(re.compile(p, re.DOTALL | re.IGNORECASE) for p in (
+    rb'window\.__INITIAL_STATE__\s*=\s*({.*?});',
+    rb'window\.__DATA__\s*=\s*({.*?});',
+    rb'data\s*:\s*(\[.*?\])',
+    rb'hashes\s*:\s*(\[.*?\])',
+))
+_GITHUB_IFRAME_DATA_RES = tuple(re.compile(p) for p in (
+    rb'<iframe[^>]*src="[^"]*#([^"]+)"',
+    rb'<iframe[^>]*src=\'[^\']*#([^\']+)\'',
+    rb'#([A-Za-z0-9+/=]{50,})',  # Base64-like strings
+))
+
+# Headers sent with every request; per-request headers only carry the differences
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+    'Referer': 'https://debridmediamanager.com/'
+}
+_INDEX_HEADERS = {
+    'Accept': 'application/json, text/html, */*'
+}
+_HASH_LIST_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache'
+}
+
+# Maps URL-safe base64 to the standard alphabet
+_URLSAFE_B64_TABLE = str.maketrans('-_', '+/')
+
+# Alphabet used by LZString.compressToEncodedURIComponent
+_LZ_URI_VALUES = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+-$")}
+
+def _lz_decompress_uri(compressed: str) -> Optional[str]:
+    """
+    Port of LZString.decompressFromEncodedURIComponent.
+    Unlike the lzstring package it maps characters through a prebuilt table and
+    reads codes with integer bit ops, instead of rebuilding the reverse alphabet
+    for every input character.
+    """
+    if not compressed:
+        return None
+    try:
+        values = [_LZ_URI_VALUES[c] for c in compressed.replace(' ', '+')]
+    except KeyError:
+        return None
+    length = len(values)
+    
+    val = values[0]
+    position = 32
+    index = 1
+    
+    def read_bits(count: int) -> int:
+        nonlocal val, position, index
+        bits = 0
+        for shift in range(count):
+            if val & position:
+                bits |= 1 << shift
+            position >>= 1
+            if position == 0:
+                position = 32
+                # Reads past the end yield zero bits, as in the JS original
+                val = values[index] if index < length else 0
+                index += 1
+        return bits
+    
+    first = read_bits(2)
+    if first == 2:
+        return ''
+    c = chr(read_bits(8 if first == 0 else 16))
+    
+    # Codes 0-2 are control codes; the list index is the dictionary code
+    dictionary = [None, None, None, c]
+    enlarge_in = 4
+    num_bits = 3
+    w = c
+    result = [c]
+    
+    while True:
+        if index > length:
+            return ''
+        
+        code = read_bits(num_bits)
+        if code == 0 or code == 1:
+            dictionary.append(chr(read_bits(8 if code == 0 else 16)))
+            code = len(dictionary) - 1
+            enlarge_in -= 1
+        elif code == 2:
+            return ''.join(result)
+        
+        if enlarge_in == 0:
+            enlarge_in = 1 << num_bits
+            num_bits += 1
+        
+        if code < len(dictionary):
+            entry = dictionary[code]
+        elif code == len(dictionary):
+            entry = w + w[0]
+        else:
+            return None
+        result.append(entry)
+        
+        dictionary.append(w + entry[0])
+        enlarge_in -= 1
+        w = entry
+        
+        if enlarge_in == 0:
+            enlarge_in = 1 << num_bits
+            num_bits += 1
+
+class DiskCache:
+    """Small on-disk cache for slow-changing DMM data, stored as zlib-compressed JSON"""
+    
+    def __init__(self, cache_dir: Path, ttl: float = 3600):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json.z"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the stored entry for key (fresh or stale), or None if there is none"""
+        try:
+            return _json_loads(zlib.decompress(self._path(key).read_bytes()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry for {key}: {e}")
+            return None
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
+    
+    def set(self, key: str, value, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        entry = {
+            'fetched_at': time.time(),
+            'value': value,
+            'etag': etag,
+            'last_modified': last_modified
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_suffix('.tmp')
+            tmp.write_bytes(zlib.compress(json.dumps(entry).encode(), 3))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Could not write cache entry for {key}: {e}")
+
 class DMMClient:
-    def __init__(self, base_url: str = "https://hashlists.debridmediamanager.com"):
+    # Index endpoint that answered last time; shared across instances and persisted to disk
+    _known_index_endpoint: Optional[str] = None
+    
+    def __init__(self, base_url: str = "https://hashlists.debridmediamanager.com",
+                 cache_dir: Path = Path('../data/cache'), cache_ttl: float = 3600):
         self.base_url = base_url.rstrip('/')
         self.dmm_api_url = "https://hashlists.debridmediamanager.com"
         self.github_api_url = "https://api.github.com/repos/debridmediamanager/hashlists/contents"
         self.raw_github_url = "https://raw.githubusercontent.com/debridmediamanager/hashlists/main"
         self.session = None
+        self.cache = DiskCache(cache_dir, ttl=cache_ttl)
         
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=60)
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the shared session, keeping connections to DMM/GitHub alive between requests"""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=60),
+            auto_decompress=True,
+            headers=_DEFAULT_HEADERS
         )
+    
+    async def __aenter__(self):
+        self.session = self._create_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
     
-    async def _ensure_session(self):
+    def _ensure_session(self):
         """Ensure we have an active session"""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=60)
-            )
+            self.session = self._create_session()
+    
+    async def _probe_index_endpoint(self, endpoint: str) -> Optional[List[str]]:
+        """Fetch one candidate DMM index endpoint, returning None if it has no usable hash lists"""
+        try:
+            async with self.session.get(endpoint, headers=_INDEX_HEADERS) as response:
+                if response.status == 200:
+                    content = await response.read()
+                    
+                    # Try to parse as JSON first
+                    try:
+                        data = _json_loads(content)
+                        if isinstance(data, list):
+                            return [item for item in data if isinstance(item, str)]
+                        elif isinstance(data, dict) and 'lists' in data:
+                            return data['lists']
+                    except ValueError:
+                        # If not JSON, look for hash list references in HTML
+                        matches = _UUID_HTML_RE.findall(content)
+                        if matches:
+                            return [f"{match.decode('ascii')}.html" for match in matches[:50]]  # Limit to 50
+        except Exception as e:
+            logger.debug(f"Failed to get hash lists from {endpoint}: {e}")
+        return None
+    
+    def _load_known_index_endpoint(self) -> Optional[str]:
+        """Return the index endpoint remembered from an earlier run, if any"""
+        if DMMClient._known_index_endpoint is None:
+            try:
+                endpoint = (self.cache.cache_dir / 'endpoint.txt').read_text().strip()
+                DMMClient._known_index_endpoint = endpoint or None
+            except OSError:
+                pass
+        return DMMClient._known_index_endpoint
+    
+    def _remember_index_endpoint(self, endpoint: str):
+        """Remember the working index endpoint so later calls skip the probe"""
+        if endpoint == DMMClient._known_index_endpoint:
+            return
+        DMMClient._known_index_endpoint = endpoint
+        try:
+            self.cache.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache.cache_dir / 'endpoint.txt').write_text(endpoint)
+        except OSError as e:
+            logger.debug(f"Could not persist index endpoint: {e}")
     
     async def get_available_hash_lists_from_dmm(self) -> List[str]:
         """Get list of available hash list files directly from DMM API"""
-        await self._ensure_session()
+        self._ensure_session()
         
         try:
             # Try to get the hash list directory or index from DMM
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/json, text/html, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://debridmediamanager.com/'
-            }
-            
             # First try to get an index or API endpoint
             possible_endpoints = [
                 f"{self.dmm_api_url}/index.json",
@@ -61,28 +294,28 @@ class DMMClient:
                 f"{self.dmm_api_url}/",
             ]
             
-            for endpoint in possible_endpoints:
-                try:
-                    async with self.session.get(endpoint, headers=headers) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            
-                            # Try to parse as JSON first
-                            try:
-                                data = json.loads(content)
-                                if isinstance(data, list):
-                                    return [item for item in data if isinstance(item, str)]
-                                elif isinstance(data, dict) and 'lists' in data:
-                                    return data['lists']
-                            except json.JSONDecodeError:
-                                # If not JSON, look for hash list references in HTML
-                                hash_list_pattern = r'([a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12})\.html'
-                                matches = re.findall(hash_list_pattern, content)
-                                if matches:
-                                    return [f"{match}.html" for match in matches[:50]]  # Limit to 50
-                except Exception as e:
-                    logger.debug(f"Failed to get hash lists from {endpoint}: {e}")
-                    continue
+            # Go straight to the endpoint that worked before
+            known_endpoint = self._load_known_index_endpoint()
+            if known_endpoint in possible_endpoints:
+                hash_lists = await self._probe_index_endpoint(known_endpoint)
+                if hash_lists is not None:
+                    return hash_lists
+                logger.debug(f"Known index endpoint {known_endpoint} failed, probing all endpoints")
+            
+            # Probe all endpoints concurrently and take the first usable answer
+            pending = {asyncio.create_task(self._probe_index_endpoint(endpoint), name=endpoint)
+                       for endpoint in possible_endpoints}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        hash_lists = task.result()
+                        if hash_lists is not None:
+                            self._remember_index_endpoint(task.get_name())
+                            return hash_lists
+            finally:
+                for task in pending:
+                    task.cancel()
             
             # Fallback: Use known hash list from your example
             logger.info("Using fallback hash list from your example")
@@ -91,93 +324,67 @@ class DMMClient:
         except Exception as e:
             logger.error(f"Error getting hash lists from DMM API: {str(e)}")
             # Fallback to GitHub method
-            return await self.get_available_hash_lists()
+            return await self.get_available_hash_lists_from_github()
     
     def _decode_lz_string(self, compressed: str) -> str:
         """Decode LZ-compressed string used by DMM"""
         try:
-            # Try to import and use the proper LZ-String library
+            # DMM iframes are always packed with LZString.compressToEncodedURIComponent
             try:
-                from lzstring import LZString
-                
-                # DMM uses LZ-String compression
-                # Try different LZ-String decompression methods
-                decompression_methods = [
-                    LZString.decompressFromBase64,
-                    LZString.decompressFromUTF16,
-                    LZString.decompressFromUint8Array,
-                    LZString.decompress
-                ]
-                
-                for method in decompression_methods:
-                    try:
-                        decoded = method(compressed)
-                        if decoded and len(decoded) > 10:  # Valid decompression should give substantial content
-                            logger.info(f"Successfully decompressed using {method.__name__}")
-                            return decoded
-                    except Exception as e:
-                        logger.debug(f"LZ decompression method {method.__name__} failed: {e}")
-                        continue
-                        
-            except ImportError:
-                logger.warning("lzstring library not available, using fallback methods")
-            
-            # Fallback methods if lzstring library not available
-            import base64
-            import urllib.parse
+                decoded = _lz_decompress_uri(compressed)
+                if decoded:
+                    return decoded
+            except Exception as e:
+                logger.debug(f"LZ decompression failed: {e}")
             
+            # Fallback methods if the data could not be LZ-decompressed
             # Method 1: Look for patterns in the compressed string that might be hashes
-            hash_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', compressed)
+            hash_patterns = _HEX40_RE.findall(compressed)
             if hash_patterns:
                 logger.info(f"Found {len(hash_patterns)} hashes directly in compressed data")
                 return '\n'.join(hash_patterns)
             
-            # Method 2: Try various base64 decoding approaches
+            # Method 2: URL-decode (a no-op on plain data), then a single base64 attempt
             try:
-                # Clean the string and try base64 decode
-                cleaned = compressed.replace('-', '+').replace('_', '/')
-                # Add padding if needed
-                while len(cleaned) % 4:
-                    cleaned += '='
-                    
-                decoded_bytes = base64.b64decode(cleaned)
-                decoded_text = decoded_bytes.decode('utf-8', errors='ignore')
-                
-                # Look for hashes in decoded text
-                hash_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', decoded_text)
-                if hash_patterns:
-                    logger.info(f"Found {len(hash_patterns)} hashes after base64 decode")
+                cleaned = urllib.parse.unquote(compressed).translate(_URLSAFE_B64_TABLE)
+                cleaned += '=' * (-len(cleaned) % 4)
+                decoded_text = base64.b64decode(cleaned).decode('utf-8', errors='ignore')
+                if _HEX40_RE.search(decoded_text):
+                    logger.info("Found hashes after base64 decode")
                     return decoded_text
-                    
             except Exception as e:
                 logger.debug(f"Base64 decode failed: {e}")
             
-            # Method 3: Try URL decode first, then base64
-            try:
-                url_decoded = urllib.parse.unquote(compressed)
-                if url_decoded != compressed:  # If it was URL encoded
-                    decoded_bytes = base64.b64decode(url_decoded + '==')
-                    decoded_text = decoded_bytes.decode('utf-8', errors='ignore')
-                    hash_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', decoded_text)
-                    if hash_patterns:
-                        logger.info(f"Found {len(hash_patterns)} hashes after URL+base64 decode")
-                        return decoded_text
-            except Exception as e:
-                logger.debug(f"URL decode failed: {e}")
-            
             return ''
             
         except Exception as e:
             logger.debug(f"Could not decode LZ string: {e}")
             return ''
     
-    async def load_hash_list_from_dmm_iframe(self, iframe_content: str) -> List[str]:
-        """Extract hashes from DMM iframe content with the long encoded string"""
+    def _extract_hashes_from_json(self, data) -> List[str]:
+        """Collect valid lowercase hashes from JSON embedded in a hash list page"""
+        if isinstance(data, dict):
+            data = data.get('hashes', [data])
+        if not isinstance(data, list):
+            return []
+        
         hashes = []
+        for item in data:
+            if isinstance(item, dict):
+                # First of the known keys holding a string; other value types are skipped
+                item = next((item[key] for key in _JSON_HASH_KEYS if isinstance(item.get(key), str)), None)
+            # JSON values are not regex-validated, check them here
+            if isinstance(item, str) and (len(item) == 40 or len(item) == 64) and _HEX_ONLY_RE.match(item):
+                hashes.append(item.lower())
+        return hashes
+    
+    def _extract_hashes_from_iframe(self, iframe_content: str) -> List[str]:
+        """Extract hashes from DMM iframe content with the long encoded string (CPU-bound, no I/O)"""
+        hashes = {}  # Insertion-ordered set of lowercase hashes
         
         try:
             # Extract the hash after the # in the iframe src
-            hash_match = re.search(r'#([A-Za-z0-9+/=\-_]+)', iframe_content)
+            hash_match = _IFRAME_HASH_RE.search(iframe_content)
             if hash_match:
                 encoded_data = hash_match.group(1)
                 logger.info(f"Found encoded data length: {len(encoded_data)} characters")
@@ -185,13 +392,9 @@ class DMMClient:
                 # Try to decode the data
                 decoded_content = self._decode_lz_string(encoded_data)
                 if decoded_content:
-                    # Extract hashes from decoded content
-                    hash_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', decoded_content)
-                    hashes.extend([h.lower() for h in hash_patterns])
-                    
-                    # Also try SHA-256 patterns
-                    hash256_patterns = re.findall(r'\b[a-fA-F0-9]{64}\b', decoded_content)
-                    hashes.extend([h.lower() for h in hash256_patterns])
+                    # Extract SHA-1 and SHA-256 hashes from decoded content
+                    for m in _HASH_RE.finditer(decoded_content):
+                        hashes[m.group(0).lower()] = None
                 
                 # If decoding didn't work, let's try a different approach
                 # Sometimes the encoded data contains the actual hash list in a different format
@@ -202,12 +405,10 @@ class DMMClient:
                     # DMM might use different encoding methods
                     
                     # Try splitting the encoded data and looking for hash-like patterns
-                    parts = re.split(r'[^\w]', encoded_data)
+                    parts = _NON_WORD_RE.split(encoded_data)
                     for part in parts:
-                        if len(part) == 40 and re.match(r'^[a-fA-F0-9]+$', part):
-                            hashes.append(part.lower())
-                        elif len(part) == 64 and re.match(r'^[a-fA-F0-9]+$', part):
-                            hashes.append(part.lower())
+                        if (len(part) == 40 or len(part) == 64) and _HEX_ONLY_RE.match(part):
+                            hashes[part.lower()] = None
                     
                     if hashes:
                         logger.info(f"Found {len(hashes)} hashes using pattern extraction")
@@ -215,87 +416,93 @@ class DMMClient:
         except Exception as e:
             logger.error(f"Error extracting hashes from iframe content: {e}")
         
-        return list(set(hashes))  # Remove duplicates
+        return list(hashes)
     
-    async def load_hash_list_from_dmm(self, filename: str) -> List[str]:
-        """Load hashes directly from DMM hash list API with improved iframe parsing"""
-        await self._ensure_session()
+    async def load_hash_list_from_dmm(self, filename: str, cached: Optional[Dict] = None) -> List[str]:
+        """
+        Load hashes directly from DMM hash list API with improved iframe parsing.
+        If a (stale) cache entry is given, the request is made conditional on its
+        ETag / Last-Modified so an unchanged list is not downloaded again.
+        """
+        self._ensure_session()
         
         try:
             # Use the DMM hash list URL directly
             url = f"{self.dmm_api_url}/{filename}"
             logger.info(f"Loading hash list from DMM: {url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://debridmediamanager.com/',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            }
+            headers = _HASH_LIST_HEADERS
+            if cached:
+                headers = dict(headers)
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
             
             async with self.session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    logger.info(f"DMM hash list unchanged since last fetch: {filename}")
+                    self.cache.set(filename, cached['value'], cached.get('etag'), cached.get('last_modified'))
+                    return cached['value']
+                
                 if response.status == 200:
-                    content = await response.text()
-                    hashes = []
+                    content = await response.read()
+                    hashes = {}  # Insertion-ordered set of lowercase hashes
                     
                     # Look for iframe with the encoded hash data
-                    iframe_pattern = r'<iframe[^>]*src="([^"]*)"[^>]*>'
-                    iframe_matches = re.findall(iframe_pattern, content, re.IGNORECASE)
+                    iframe_matches = [src.decode('utf-8', errors='ignore') for src in _IFRAME_RE.findall(content)]
                     
                     for iframe_src in iframe_matches:
                         logger.info(f"Processing iframe src: {iframe_src[:100]}...")
-                        iframe_hashes = await self.load_hash_list_from_dmm_iframe(iframe_src)
-                        hashes.extend(iframe_hashes)
+                    
+                    # Decode iframes in worker threads so the event loop keeps serving other requests
+                    iframe_results = await asyncio.gather(*[
+                        asyncio.to_thread(self._extract_hashes_from_iframe, iframe_src)
+                        for iframe_src in iframe_matches
+                    ])
+                    for iframe_hashes in iframe_results:
+                        hashes.update(dict.fromkeys(iframe_hashes))
                     
                     # If we found hashes from iframe, return them
                     if hashes:
-                        hashes = list(set(hashes))  # Remove duplicates
                         logger.info(f"Successfully extracted {len(hashes)} hashes from DMM iframe")
+                        hashes = list(hashes)
+                        self.cache.set(filename, hashes,
+                                       response.headers.get('ETag'), response.headers.get('Last-Modified'))
                         return hashes
                     
                     # Fallback: try other extraction methods
                     logger.info("No hashes found in iframe, trying other methods...")
                     
-                    # Method 1: Look for JSON data in script tags
-                    script_patterns = [
-                        r'<script[^>]*>(.*?)</script>',
-                        r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-                        r'window\.__DATA__\s*=\s*({.*?});',
-                        r'data\s*:\s*(\[.*?\])',
-                        r'hashes\s*:\s*(\[.*?\])',
-                    ]
-                    
-                    for pattern in script_patterns:
-                        matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
+                    # Method 1: Look for JSON data in script tags. The page is walked once to
+                    # collect script bodies; the data patterns then only scan those bodies.
+                    for script in _SCRIPT_RE.findall(content):
+                        matches = [script]
+                        for pattern in _SCRIPT_DATA_RES:
+                            matches.extend(pattern.findall(script))
                         for match in matches:
                             try:
                                 # Try to extract JSON data
-                                if match.strip().startswith('{') or match.strip().startswith('['):
-                                    data = json.loads(match)
-                                    extracted_hashes = self._extract_hashes_from_json(data)
-                                    hashes.extend(extracted_hashes)
-                            except (json.JSONDecodeError, TypeError):
+                                if match.strip().startswith((b'{', b'[')):
+                                    data = _json_loads(match)
+                                    for h in self._extract_hashes_from_json(data):
+                                        hashes[h] = None
+                            except (ValueError, TypeError):
                                 # Look for hex patterns in the script content
-                                hex_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', match)
-                                hashes.extend([h.lower() for h in hex_patterns])
+                                for m in _HEX40_BYTES_RE.finditer(match):
+                                    hashes[m.group(0).decode('ascii').lower()] = None
                     
-                    # Method 2: Direct hex pattern extraction
+                    # Method 2: Direct SHA-1 / SHA-256 pattern extraction
                     if not hashes:
-                        hex_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', content)
-                        hashes.extend([h.lower() for h in hex_patterns])
-                        
-                        # Also try SHA256
-                        hex256_patterns = re.findall(r'\b[a-fA-F0-9]{64}\b', content)
-                        hashes.extend([h.lower() for h in hex256_patterns])
+                        for m in _HASH_BYTES_RE.finditer(content):
+                            hashes[m.group(0).decode('ascii').lower()] = None
                     
-                    # Remove duplicates and filter valid hashes
-                    hashes = list(set(h for h in hashes if len(h) in [40, 64] and h.isalnum()))
+                    hashes = list(hashes)
                     
                     if hashes:
                         logger.info(f"Loaded {len(hashes)} hashes from DMM: {filename}")
+                        self.cache.set(filename, hashes,
+                                       response.headers.get('ETag'), response.headers.get('Last-Modified'))
                         return hashes
                     else:
                         logger.warning(f"No hashes found in DMM hash list: {filename}")
@@ -310,20 +517,32 @@ class DMMClient:
     
     async def get_available_hash_lists(self) -> List[str]:
         """Get list of available hash list files - try DMM first, fallback to GitHub"""
+        cached = self.cache.get('index')
+        if cached and self.cache.is_fresh(cached):
+            logger.info(f"Using {len(cached['value'])} cached hash list files")
+            return cached['value']
+        
         # First try the DMM API directly
-        dmm_lists = await self.get_available_hash_lists_from_dmm()
-        if dmm_lists:
-            logger.info(f"Found {len(dmm_lists)} hash list files from DMM API")
-            return dmm_lists
+        hash_files = await self.get_available_hash_lists_from_dmm()
+        if hash_files:
+            logger.info(f"Found {len(hash_files)} hash list files from DMM API")
+        else:
+            # Fallback to GitHub method
+            hash_files = await self.get_available_hash_lists_from_github()
         
-        # Fallback to GitHub method
-        await self._ensure_session()
+        if hash_files:
+            self.cache.set('index', hash_files)
+        return hash_files
+    
+    async def get_available_hash_lists_from_github(self) -> List[str]:
+        """Get list of available hash list files from the DMM hashlists GitHub repo"""
+        self._ensure_session()
         
         try:
             # Get files from GitHub API
             async with self.session.get(self.github_api_url) as response:
                 if response.status == 200:
-                    files_data = await response.json()
+                    files_data = await response.json(loads=_json_loads)
                     
                     # Filter for .html files (hash lists) - DMM uses .html extension
                     hash_files = []
@@ -346,14 +565,43 @@ class DMMClient:
             return []
     
     async def load_hash_list(self, filename: str) -> List[str]:
-        """Load hashes from a specific hash list file - try DMM first, fallback to GitHub"""
+        """
+        Load hashes from a specific hash list file - try DMM first, fallback to GitHub.
+        Returns [] when no hashes could be extracted from either source.
+        """
+        cached = self.cache.get(filename)
+        if cached and self.cache.is_fresh(cached):
+            logger.info(f"Using {len(cached['value'])} cached hashes for {filename}")
+            return cached['value']
+        
         # First try loading directly from DMM
-        dmm_hashes = await self.load_hash_list_from_dmm(filename)
+        dmm_hashes = await self.load_hash_list_from_dmm(filename, cached)
         if dmm_hashes:
             return dmm_hashes
         
         # Fallback to GitHub method
-        await self._ensure_session()
+        hashes = await self.load_hash_list_from_github(filename)
+        if hashes:
+            self.cache.set(filename, hashes)
+        return hashes
+    
+    async def load_hash_lists(self, filenames: List[str], concurrency: int = 16) -> Dict[str, List[str]]:
+        """Load several hash list files concurrently, returning a filename -> hashes mapping"""
+        self._ensure_session()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def load_one(filename: str):
+            async with semaphore:
+                return filename, await self.load_hash_list(filename)
+        
+        return dict(await asyncio.gather(*(load_one(filename) for filename in filenames)))
+    
+    async def load_hash_list_from_github(self, filename: str) -> List[str]:
+        """
+        Load hashes for a hash list file from the DMM hashlists GitHub repo.
+        Returns [] when the file could not be fetched or no hashes could be extracted.
+        """
+        self._ensure_session()
         
         try:
             # Use GitHub raw URL to get the actual file content
@@ -362,74 +610,58 @@ class DMMClient:
             
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    content = await response.read()
                     
                     # Extract hash data from HTML
-                    hashes = []
+                    hashes = {}  # Insertion-ordered set of lowercase hashes
                     
                     # Method 1: Look for iframe src with hash data
-                    iframe_patterns = [
-                        r'<iframe[^>]*src="[^"]*#([^"]+)"',
-                        r'<iframe[^>]*src=\'[^\']*#([^\']+)\'',
-                        r'#([A-Za-z0-9+/=]{50,})',  # Base64-like strings
-                    ]
-                    
-                    for pattern in iframe_patterns:
-                        matches = re.findall(pattern, content)
-                        for encoded_data in matches:
+                    for pattern in _GITHUB_IFRAME_DATA_RES:
+                        if len(hashes) >= _GITHUB_HASH_LIMIT:
+                            break
+                        for encoded_data in pattern.finditer(content):
+                            if len(hashes) >= _GITHUB_HASH_LIMIT:
+                                break
                             try:
                                 # Try to decode the compressed data
-                                decoded_content = self._decode_lz_string(encoded_data)
+                                decoded_content = self._decode_lz_string(encoded_data.group(1).decode('utf-8', errors='ignore'))
                                 if decoded_content:
-                                    # Look for hashes in decoded content
-                                    hash_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', decoded_content)
-                                    hashes.extend([h.lower() for h in hash_patterns])
-                                    
-                                    # Also try SHA256 hashes
-                                    hash256_patterns = re.findall(r'\b[a-fA-F0-9]{64}\b', decoded_content)
-                                    hashes.extend([h.lower() for h in hash256_patterns])
+                                    # Look for SHA1 / SHA256 hashes in decoded content
+                                    for m in _HASH_RE.finditer(decoded_content):
+                                        hashes[m.group(0).lower()] = None
+                                        if len(hashes) >= _GITHUB_HASH_LIMIT:
+                                            break
                                     
                                     # Try to extract from JSON if present
                                     try:
-                                        if decoded_content.strip().startswith('{') or decoded_content.strip().startswith('['):
-                                            json_data = json.loads(decoded_content)
-                                            if isinstance(json_data, list):
-                                                for item in json_data:
-                                                    if isinstance(item, str) and len(item) in [40, 64]:
-                                                        hashes.append(item.lower())
-                                                    elif isinstance(item, dict):
-                                                        for key in ['hash', 'btih', 'info_hash']:
-                                                            if key in item and isinstance(item[key], str):
-                                                                hashes.append(item[key].lower())
-                                    except json.JSONDecodeError:
+                                        if decoded_content.strip().startswith(('{', '[')):
+                                            json_data = _json_loads(decoded_content)
+                                            for h in self._extract_hashes_from_json(json_data):
+                                                if len(hashes) >= _GITHUB_HASH_LIMIT:
+                                                    break
+                                                hashes[h] = None
+                                    except ValueError:
                                         pass
                             except Exception as e:
                                 logger.debug(f"Could not decode iframe data: {e}")
                                 continue
                     
-                    # Method 2: Direct hash extraction from HTML
+                    # Method 2: Direct hash extraction from HTML, stopping once the limit is reached
                     if not hashes:
-                        # Look for 40-character hex strings (SHA1)
-                        hash_patterns = re.findall(r'\b[a-fA-F0-9]{40}\b', content)
-                        hashes.extend([h.lower() for h in hash_patterns])
-                        
-                        # Look for 64-character hex strings (SHA256)
-                        hash256_patterns = re.findall(r'\b[a-fA-F0-9]{64}\b', content)
-                        hashes.extend([h.lower() for h in hash256_patterns])
+                        # Look for 40- or 64-character hex strings (SHA1 / SHA256) in one pass
+                        for m in _HASH_BYTES_RE.finditer(content):
+                            hashes[m.group(0).decode('ascii').lower()] = None
+                            if len(hashes) >= _GITHUB_HASH_LIMIT:
+                                break
                     
-                    # Remove duplicates and invalid hashes
-                    hashes = list(set(h for h in hashes if len(h) in [40, 64] and h.isalnum()))
+                    hashes = list(hashes)
                     
-                    # If still no hashes, create a sample hash for testing
                     if not hashes:
-                        logger.warning(f"No hashes found in {filename}, creating sample hash for testing")
-                        # Create a deterministic hash based on filename for consistency
-                        import hashlib
-                        sample_hash = hashlib.sha1(filename.encode()).hexdigest()
-                        hashes = [sample_hash]
+                        logger.warning(f"No hashes found in GitHub hash list: {filename}")
+                        return []
                     
                     logger.info(f"Loaded {len(hashes)} hashes from {filename}")
-                    return hashes[:1000]  # Limit to first 1000 hashes per file
+                    return hashes
                 else:
                     logger.error(f"Failed to load hash list {filename}: {response.status}")
                     return []
@@ -440,7 +672,7 @@ class DMMClient:
     
     async def get_hash_info(self, hash_str: str) -> Optional[Dict]:
         """Get information about a specific hash (if DMM provides this endpoint)"""
-        await self._ensure_session()
+        self._ensure_session()
         
         try:
             # This endpoint may not exist - DMM typically just provides raw hash lists
@@ -458,7 +690,7 @@ class DMMClient:
     
     async def search_content(self, query: str, content_type: str = "all") -> List[Dict]:
         """Search for content in DMM (if search endpoint exists)"""
-        await self._ensure_session()
+        self._ensure_session()
         
         try:
             params = {
@@ -478,7 +710,7 @@ class DMMClient:
     
     async def get_popular_content(self, content_type: str = "movies", limit: int = 100) -> List[str]:
         """Get popular content hashes (if endpoint exists)"""
-        await self._ensure_session()
+        self._ensure_session()
         
         try:
             params = {
@@ -511,13 +743,14 @@ async def example_usage():
         hash_files = await dmm.get_available_hash_lists()
         print(f"Available hash lists: {hash_files}")
         
-        # Load a specific hash list
+        # Load all hash lists concurrently
         if hash_files:
-            hashes = await dmm.load_hash_list(hash_files[0])
-            print(f"Loaded {len(hashes)} hashes")
+            hash_lists = await dmm.load_hash_lists(hash_files)
+            for filename, hashes in hash_lists.items():
+                print(f"Loaded {len(hashes)} hashes from {filename}")
             
             # Process first few hashes
-            for hash_str in hashes[:5]:
+            for hash_str in hash_lists[hash_files[0]][:5]:
                 info = await dmm.get_hash_info(hash_str)
                 if info:
                     print(f"Hash {hash_str}: {info}")
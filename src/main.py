@@ -9,13 +9,35 @@ import json
 import logging
 import asyncio
 import re
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from dmm_client import DMMClient
-from real_debrid_client import RealDebridClient
+from dmm_client import DMMClient, DiskCache
+from real_debrid_client import RealDebridClient, AVAILABILITY_BATCH_SIZE, TORRENTS_PAGE_LIMIT
 from notifier import NotificationService
+from rate_limiter import AdaptiveRateLimiter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Setup logging
 logging.basicConfig(
@@ -28,27 +50,149 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common adult content indicators in filenames
+_ADULT_KEYWORDS = (
+    'xxx', 'porn', 'adult', 'sex', 'anal', 'brazzers', 'bangbros', 'naughty', 
+    'playboy', 'penthouse', 'hustler', 'x-art', 'mofos', 'blacked', 'reality kings',
+    'pornhub', 'xvideos', 'milf', 'mature', 'pussy', 'cock', 'dick', 'nude', 'hardcore'
+)
+
+# Movie indicators
+_MOVIE_KEYWORDS = (
+    '1080p', '720p', '2160p', 'bdrip', 'brrip', 'bluray', 'webrip', 'dvdrip', 
+    'x264', 'x265', 'h264', 'h265', 'hevc', 'remux', 'hdr', 'dts', 'aac', 'atmos'
+)
+
+# TV show indicators
+_TV_KEYWORDS = (
+    's01', 's02', 's03', 's04', 's05', 'e01', 'e02', 'e03', 'season', 'episode',
+    'complete.series', 'complete.season', 'tv.pack'
+)
+
+# Quality indicators in order of precedence
+_QUALITY_PAIRS = (
+    ('8k', '8K'),
+    ('4k', '4K'),
+    ('2160p', '4K'),
+    ('1080p', 'FHD'),
+    ('720p', 'HD'),
+    ('bluray', 'BluRay'),
+    ('bdrip', 'BluRay'),
+    ('hdr', 'HDR'),
+    ('webrip', 'WebRip'),
+    ('web-dl', 'WEB-DL'),
+    ('web.dl', 'WEB-DL'),
+    ('dvdrip', 'DVDRip')
+)
+
+# Magnet links are built from the info hash alone
+_MAGNET_PREFIX = 'magnet:?xt=urn:btih:'
+
+# Substring matchers for each keyword list, compiled once
+_ADULT_RE = re.compile('|'.join(map(re.escape, _ADULT_KEYWORDS)))
+_MOVIE_RE = re.compile('|'.join(map(re.escape, _MOVIE_KEYWORDS)))
+_TV_RE = re.compile('|'.join(map(re.escape, _TV_KEYWORDS)))
+
+@lru_cache(maxsize=None)
+def _keyword_re(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compiled substring matcher for any of the keywords, or None when there are none"""
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+@lru_cache(maxsize=4096)
+def _classify_names(joined_names: str) -> str:
+    """Content type for newline-joined lowercase filenames, memoized as releases recur across lists"""
+    # Check for adult content first (most important to filter)
+    if _ADULT_RE.search(joined_names):
+        return "adult"
+    
+    # Check for TV shows
+    if _TV_RE.search(joined_names):
+        return "tv"
+    
+    # Check for movies
+    if _MOVIE_RE.search(joined_names):
+        return "movie"
+    
+    # Default to other if no specific type detected
+    return "other"
+
+@lru_cache(maxsize=4096)
+def _quality_from_names(joined_names: str) -> str:
+    """Quality label for space-joined lowercase filenames, memoized like _classify_names"""
+    for indicator, quality in _QUALITY_PAIRS:
+        if indicator in joined_names:
+            return quality
+            
+    return ""
+
+def _content_dict(content) -> Optional[Dict]:
+    """Content item as a dict; objects with hash/title attributes are converted, anything else is None"""
+    if isinstance(content, dict):
+        return content
+    if hasattr(content, 'hash'):
+        item = {'hash': content.hash}
+        if hasattr(content, 'title'):
+            item['title'] = content.title
+        return item
+    return None
+
 class HashListAutoAdd:
     def __init__(self):
         self.config = self.load_config()
+        # Per-run and per-hash-list item limits, fixed once the config is loaded
+        self._max_items_per_run = self.config.get('max_items_per_run', 50)
+        self._max_items_per_batch = max(5, self._max_items_per_run // self.config.get('hash_list_limit', 20))
+        # Adds still allowed this run, reserved before each add_magnet; None means no run limit
+        self._adds_remaining = None
+        self._adds_in_flight = 0
+        self._add_slots = asyncio.Condition()
+        # Filter settings, read once instead of on every filter_content call
+        content_types_config = self.config.get('content_types', {})
+        self._movies_enabled = content_types_config.get('movies', True)
+        self._tv_enabled = content_types_config.get('tv_shows', True)
+        # Size limits in bytes, so items are compared without converting each size to GB
+        self._min_size_bytes = int(self.config.get('min_size_gb', 0.5) * 1024**3)
+        self._max_size_bytes = int(self.config.get('max_size_gb', 50.0) * 1024**3)
+        self._exclude_re = _keyword_re(tuple(keyword.lower() for keyword in self.config.get('exclude_keywords') or []))
+        self._include_re = _keyword_re(tuple(keyword.lower() for keyword in self.config.get('include_keywords') or []))
         self.dmm = None  # Initialize as None, will be created in __aenter__
         self.real_debrid = None  # Initialize as None, will be created in __aenter__
         self.notifier = NotificationService()
         self.logger = logging.getLogger(__name__)  # Add missing logger
+        # Paces every Real-Debrid request and backs off after rate limits; shared with the client
+        self.rd_limiter = AdaptiveRateLimiter(self.config.get('rd_requests_per_minute', 200))
+        # Caps Real-Debrid requests in flight across all hash lists processed at once
+        self._rd_semaphore = asyncio.Semaphore(self.config.get('rd_concurrency', 8))
         
         # Data storage
         self.data_dir = Path('../data')
         self.data_dir.mkdir(exist_ok=True)
         self.processed_file = self.data_dir / 'processed_hashes.json'
+        # Hashes processed since the last snapshot, appended one per line
+        self.processed_log = self.data_dir / 'processed_hashes.log'
+        # The log being compacted into a snapshot, kept until the snapshot is written
+        self.rotated_log = self.data_dir / 'processed_hashes.log.1'
+        self._log_fp = None
+        self._unsaved_count = 0
+        self._save_lock = asyncio.Lock()
         self.processed_hashes = self.load_processed_hashes()
         
+        # Real-Debrid content checks from earlier runs, keyed by lowercase hash
+        self.rd_cache = DiskCache(self.data_dir / 'cache')
+        self.rd_cache_ttl = self.config.get('rd_cache_ttl', 86400)
+        self.rd_content = self.load_rd_content_cache()
+        self._rd_content_dirty = False
+        
     def load_config(self) -> Dict:
         """Load configuration from config file"""
         config_file = Path('../config/settings.yml')
         if config_file.exists():
             import yaml
             with open(config_file) as f:
-                config = yaml.safe_load(f)
+                # libyaml's C loader when PyYAML was built with it
+                config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         else:
             config = {}
         
@@ -90,6 +234,10 @@ class HashListAutoAdd:
             'max_items_per_run': 30,      # Don't add too many at once
             'hash_list_limit': 15,        # Number of hash lists to process per run
             'check_interval': 6,          # Hours between runs
+            'rd_concurrency': 8,          # Concurrent Real-Debrid requests
+            'rd_requests_per_minute': 200,  # Real-Debrid allows 250 requests per minute
+            'hash_list_concurrency': 4,   # Hash lists processed at the same time
+            'rd_cache_ttl': 86400,        # Seconds to reuse Real-Debrid content checks
         }
         
         # Merge with defaults
@@ -110,34 +258,96 @@ class HashListAutoAdd:
         return config
     
     def load_processed_hashes(self) -> Set[str]:
-        """Load already processed hash IDs"""
+        """Load already processed hash IDs from the snapshot plus any newer log entries"""
+        hashes = set()
         if self.processed_file.exists():
-            with open(self.processed_file) as f:
-                data = json.load(f)
-                return set(data.get('processed_hashes', []))
-        return set()
+            data = _json_loads(self.processed_file.read_bytes())
+            hashes.update(h.lower() for h in data.get('processed_hashes', []))
+        logged = set()
+        for log_file in (self.rotated_log, self.processed_log):
+            if log_file.exists():
+                with open(log_file) as f:
+                    logged.update(line.strip().lower() for line in f)
+        logged.discard('')
+        self._unsaved_count = len(logged - hashes)
+        hashes |= logged
+        return hashes
     
-    def save_processed_hashes(self):
-        """Save processed hash IDs"""
-        data = {
-            'processed_hashes': list(self.processed_hashes),
-            'last_updated': datetime.now().isoformat(),
-            'total_processed': len(self.processed_hashes)
-        }
-        with open(self.processed_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _append_processed(self, hash_value: str):
+        """Mark a hash as processed and append it to the log, so saving doesn't rewrite the whole set"""
+        hash_value = hash_value.lower()
+        if hash_value in self.processed_hashes:
+            return
+        self.processed_hashes.add(hash_value)
+        try:
+            if self._log_fp is None:
+                self._log_fp = open(self.processed_log, 'a')
+            self._log_fp.write(hash_value + '\n')
+            self._log_fp.flush()
+        except OSError as e:
+            logger.error(f"Error appending to processed hashes log: {e}")
+        self._unsaved_count += 1
+    
+    async def save_processed_hashes(self):
+        """Save processed hash IDs, compacting the append log into the snapshot"""
+        # Saves run one at a time, so an older snapshot never replaces a newer one
+        async with self._save_lock:
+            # Nothing new since the last snapshot: keep the existing file
+            if not self._unsaved_count and self.processed_file.exists():
+                return
+            
+            data = {
+                'processed_hashes': list(self.processed_hashes),
+                'last_updated': datetime.now().isoformat(),
+                'total_processed': len(self.processed_hashes)
+            }
+            # Set the log aside with the hashes in this snapshot; hashes processed while it is
+            # written go to a new log and stay unsaved
+            pending = self._unsaved_count
+            if self._log_fp is not None:
+                self._log_fp.close()
+                self._log_fp = None
+            if self.processed_log.exists():
+                os.replace(self.processed_log, self.rotated_log)
+            
+            # Encoding and writing a large snapshot happens off the event loop
+            await asyncio.to_thread(self._write_processed_snapshot, data)
+            
+            # Every hash from the rotated log is in the snapshot now
+            self.rotated_log.unlink(missing_ok=True)
+            self._unsaved_count -= pending
 
+    def _write_processed_snapshot(self, data: Dict):
+        """Write a sibling file and swap it in, so a killed run never leaves a truncated snapshot"""
+        tmp_file = self.processed_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp_file, self.processed_file)
+    
+    def load_rd_content_cache(self) -> Dict[str, Dict]:
+        """Load cached Real-Debrid content checks, dropping entries older than rd_cache_ttl"""
+        entry = self.rd_cache.get('rd_content')
+        if not entry or not isinstance(entry.get('value'), dict):
+            return {}
+        cutoff = time.time() - self.rd_cache_ttl
+        return {h: cached for h, cached in entry['value'].items() if cached.get('checked_at', 0) > cutoff}
+    
+    async def save_rd_content_cache(self):
+        """Persist the Real-Debrid content checks if any were added this run"""
+        if self._rd_content_dirty:
+            await asyncio.to_thread(self.rd_cache.set, 'rd_content', self.rd_content)
+            self._rd_content_dirty = False
+    
     def load_real_dmm_hashes(self) -> List[str]:
         """Load real torrent hashes from the extracted DMM data"""
         try:
             # Try to load from the real_dmm_hashes.json file
             hash_file = Path('../real_dmm_hashes.json')
             if hash_file.exists():
-                with open(hash_file) as f:
-                    data = json.load(f)
-                    hashes = data.get('hashes', [])
-                    logger.info(f"Loaded {len(hashes)} real DMM hashes from {hash_file}")
-                    return hashes
+                data = _json_loads(hash_file.read_bytes())
+                hashes = data.get('hashes', [])
+                logger.info(f"Loaded {len(hashes)} real DMM hashes from {hash_file}")
+                return hashes
             else:
                 logger.warning("real_dmm_hashes.json not found. Run decode_dmm_hashes.py first to extract real hashes.")
                 return []
@@ -151,7 +361,7 @@ class HashListAutoAdd:
         logger.info("Starting DebridAuto automation with DMM hash list processing")
         
         # Always ensure the processed hashes file exists, even if empty
-        self.save_processed_hashes()
+        await self.save_processed_hashes()
         
         try:
             # Check Real-Debrid service status before proceeding
@@ -171,7 +381,7 @@ class HashListAutoAdd:
                             "⚠️ DebridAuto Run Skipped",
                             f"Real-Debrid service is experiencing 503 errors and did not recover within 15 minutes.\nWill retry in next scheduled run."
                         )
-                        self.save_processed_hashes()
+                        await self.save_processed_hashes()
                         return
                 elif service_status['status'] == 'auth_error':
                     logger.error("Authentication error - check your API key")
@@ -179,11 +389,12 @@ class HashListAutoAdd:
                         "❌ DebridAuto Authentication Error",
                         "Invalid API key or authentication failed. Please check your Real-Debrid API key."
                     )
-                    self.save_processed_hashes()
+                    await self.save_processed_hashes()
                     return
                 elif service_status['status'] == 'rate_limited':
-                    logger.warning("Rate limited, waiting 5 minutes before proceeding...")
-                    await asyncio.sleep(300)  # Wait 5 minutes
+                    # The client already registered the backoff, for exactly as long as Real-Debrid
+                    # asked when it sent Retry-After; the next request waits it out in the limiter
+                    logger.warning("Rate limited, holding Real-Debrid requests until the backoff has passed...")
                 else:
                     logger.warning(f"Service status {service_status['status']}, proceeding with caution...")
             else:
@@ -201,7 +412,7 @@ class HashListAutoAdd:
                     await self.process_hash_batch(real_hashes, "static_file")
                 else:
                     logger.error("No hashes available from any source")
-                self.save_processed_hashes()
+                await self.save_processed_hashes()
                 return
             
             logger.info(f"Found {len(available_hash_lists)} DMM hash lists")
@@ -219,56 +430,40 @@ class HashListAutoAdd:
             total_added = 0
             total_failed = 0
             total_skipped = 0
-            all_results = {'added': [], 'failed': [], 'skipped': []}
-            
-            for i, hash_list_filename in enumerate(available_hash_lists, 1):
-                logger.info(f"Processing hash list {i}/{len(available_hash_lists)}: {hash_list_filename}")
+            # Only appended to and iterated, so deques avoid list regrowth on long runs
+            all_results = {'added': deque(), 'failed': deque(), 'skipped': deque()}
+            
+            # Process hash lists concurrently; downloads of some lists overlap with the
+            # Real-Debrid work for others
+            semaphore = asyncio.Semaphore(self.config.get('hash_list_concurrency', 4))
+            max_items = self._max_items_per_run
+            self._adds_remaining = max_items
+            
+            async def process_list(i, hash_list_filename):
+                nonlocal total_added, total_failed, total_skipped
+                batch_results = await self._process_one_list(
+                    i, len(available_hash_lists), hash_list_filename, existing_torrents, semaphore)
+                if not batch_results:
+                    return
                 
-                try:
-                    # Load hashes from this specific hash list
-                    hash_list_hashes = await self.dmm.load_hash_list(hash_list_filename)
-                    
-                    if not hash_list_hashes:
-                        logger.warning(f"No hashes found in {hash_list_filename}, skipping")
-                        continue
-                    
-                    logger.info(f"Loaded {len(hash_list_hashes)} hashes from {hash_list_filename}")
-                    
-                    # Process this batch of hashes
-                    batch_results = await self.process_hash_batch(
-                        hash_list_hashes, 
-                        hash_list_filename, 
-                        existing_torrents
-                    )
-                    
-                    # Accumulate results
-                    total_added += len(batch_results['added'])
-                    total_failed += len(batch_results['failed'])
-                    total_skipped += len(batch_results['skipped'])
-                    
-                    all_results['added'].extend(batch_results['added'])
-                    all_results['failed'].extend(batch_results['failed'])
-                    all_results['skipped'].extend(batch_results['skipped'])
-                    
-                    logger.info(f"Hash list {hash_list_filename} results: "
-                              f"Added: {len(batch_results['added'])}, "
-                              f"Failed: {len(batch_results['failed'])}, "
-                              f"Skipped: {len(batch_results['skipped'])}")
-                    
-                    # Check if we've reached the max items limit
-                    max_items = self.config.get('max_items_per_run', 50)
-                    if total_added >= max_items:
-                        logger.info(f"Reached maximum items limit ({max_items}), stopping processing")
-                        break
-                    
-                    # Add delay between hash lists to avoid overwhelming the API
-                    if i < len(available_hash_lists):
-                        logger.info("Waiting 30 seconds before processing next hash list...")
-                        await asyncio.sleep(30)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing hash list {hash_list_filename}: {e}")
-                    continue
+                # Accumulate results
+                total_added += len(batch_results['added'])
+                total_failed += len(batch_results['failed'])
+                total_skipped += len(batch_results['skipped'])
+                
+                all_results['added'].extend(batch_results['added'])
+                all_results['failed'].extend(batch_results['failed'])
+                all_results['skipped'].extend(batch_results['skipped'])
+            
+            # Once the limit is reached, queued lists return without loading and no new adds
+            # start, while adds already sent to Real-Debrid finish and are recorded. The task
+            # group only cancels the lists when the run itself is interrupted.
+            async with asyncio.TaskGroup() as task_group:
+                for i, hash_list_filename in enumerate(available_hash_lists, 1):
+                    task_group.create_task(process_list(i, hash_list_filename))
+            
+            if self._limit_reached():
+                logger.info(f"Reached maximum items limit ({max_items}), stopped processing")
             
             logger.info(f"Total results across all hash lists: "
                        f"Added: {total_added}, Failed: {total_failed}, Skipped: {total_skipped}")
@@ -278,11 +473,11 @@ class HashListAutoAdd:
                 await self.send_notification(all_results)
             
             # Save processed hashes
-            self.save_processed_hashes()
+            await self.save_processed_hashes()
             
         except Exception as e:
             logger.error(f"Error in automation: {str(e)}")
-            self.save_processed_hashes()
+            await self.save_processed_hashes()
             try:
                 await self.notifier.send_notification(
                     "❌ DebridAuto Error",
@@ -301,11 +496,55 @@ class HashListAutoAdd:
             except Exception as e:
                 logger.debug(f"Error closing sessions: {e}")
 
+    async def _process_one_list(self, index: int, total: int, hash_list_filename: str,
+                                existing_torrents: Set[str], semaphore: asyncio.Semaphore) -> Optional[Dict]:
+        """Load and process one DMM hash list; returns its batch results, or None if nothing was processed"""
+        async with semaphore:
+            if self._limit_reached():
+                logger.info(f"Maximum items limit reached, not processing {hash_list_filename}")
+                return None
+            
+            logger.info(f"Processing hash list {index}/{total}: {hash_list_filename}")
+            
+            try:
+                # Load hashes from this specific hash list
+                hash_list_hashes = await self.dmm.load_hash_list(hash_list_filename)
+                
+                if not hash_list_hashes:
+                    logger.warning(f"No hashes found in {hash_list_filename}, skipping")
+                    return None
+                
+                logger.info(f"Loaded {len(hash_list_hashes)} hashes from {hash_list_filename}")
+                
+                # Process this batch of hashes
+                batch_results = await self.process_hash_batch(
+                    hash_list_hashes, 
+                    hash_list_filename, 
+                    existing_torrents
+                )
+                
+                logger.info(f"Hash list {hash_list_filename} results: "
+                          f"Added: {len(batch_results['added'])}, "
+                          f"Failed: {len(batch_results['failed'])}, "
+                          f"Skipped: {len(batch_results['skipped'])}")
+                return batch_results
+                
+            except Exception as e:
+                logger.error(f"Error processing hash list {hash_list_filename}: {e}")
+                return None
+    
     async def process_hash_batch(self, hashes: List[str], source_name: str, existing_torrents: Set[str] = None) -> Dict:
         """Process a batch of hashes from a specific source"""
         if existing_torrents is None:
             existing_torrents = await self.check_existing_torrents()
         
+        # Lowercase and drop repeated hashes before any Real-Debrid request is made for them;
+        # everything after this only sees the canonical form, once per hash
+        unique_hashes = list(dict.fromkeys(h.lower() for h in hashes))
+        if len(unique_hashes) < len(hashes):
+            logger.info(f"Dropped {len(hashes) - len(unique_hashes)} duplicate hashes from {source_name}")
+        hashes = unique_hashes
+        
         logger.info(f"Processing {len(hashes)} hashes from {source_name}")
         
         # Parse content from hashes
@@ -316,27 +555,15 @@ class HashListAutoAdd:
         filtered_content = self.filter_content(content_items)
         logger.info(f"After filtering: {len(filtered_content)} items from {source_name}")
         
-        # Remove already processed hashes
-        new_content = [item for item in filtered_content 
-                      if item['hash'] not in self.processed_hashes]
-        logger.info(f"Found {len(new_content)} new items to process from {source_name}")
-        
-        if not new_content:
-            logger.info(f"No new content to process from {source_name}")
-            return {'added': [], 'failed': [], 'skipped': []}
-        
-        # Remove content that already exists in Real-Debrid
-        unique_content = [item for item in new_content 
-                         if item['hash'].lower() not in existing_torrents]
-        logger.info(f"After removing existing torrents: {len(unique_content)} items remain from {source_name}")
+        # Drop hashes already in Real-Debrid; filter_content has dropped processed ones and
+        # items are unique by hash. Item hashes and existing torrents are all lowercase.
+        unique_content = [item for item in filtered_content if item['hash'] not in existing_torrents]
         
-        # Remove duplicates within this batch
-        unique_content = await self.check_content_similarity(unique_content)
-        logger.info(f"After deduplication: {len(unique_content)} unique items from {source_name}")
+        logger.info(f"Skipped {len(filtered_content) - len(unique_content)} existing items: "
+                    f"{len(unique_content)} unique items from {source_name}")
         
         # Limit items for this batch (distribute the limit across hash lists)
-        max_items_total = self.config.get('max_items_per_run', 50)
-        max_items_per_batch = max(5, max_items_total // self.config.get('hash_list_limit', 20))
+        max_items_per_batch = self._max_items_per_batch
         
         if len(unique_content) > max_items_per_batch:
             unique_content = unique_content[:max_items_per_batch]
@@ -354,159 +581,53 @@ class HashListAutoAdd:
             logger.info(f"No unique content to add from {source_name}")
             return {'added': [], 'failed': [], 'skipped': []}
     
-    async def run_automation_old(self):
-        """Main automation loop with real DMM hashes"""
-        logger.info("Starting DebridAuto automation with real DMM hashes")
-        
-        # Always ensure the processed hashes file exists, even if empty
-        self.save_processed_hashes()
-        
-        try:
-            # Check Real-Debrid service status before proceeding
-            logger.info("Checking Real-Debrid service status...")
-            service_status = await self.real_debrid.check_service_status()
-            
-            if service_status['status'] != 'healthy':
-                logger.warning(f"Real-Debrid service status: {service_status['status']}")
-                
-                if service_status['status'] == 'service_unavailable':
-                    logger.info("Service unavailable (503 error), waiting for recovery...")
-                    if await self.real_debrid.wait_for_service_recovery(max_wait_minutes=15):
-                        logger.info("Service recovered, continuing with automation...")
-                    else:
-                        logger.error("Service did not recover, aborting this run")
-                        await self.notifier.send_notification(
-                            "⚠️ DebridAuto Run Skipped",
-                            f"Real-Debrid service is experiencing 503 errors and did not recover within 15 minutes.\nWill retry in next scheduled run."
-                        )
-                        # Always save processed hashes file even when aborting
-                        self.save_processed_hashes()
-                        return
-                elif service_status['status'] == 'auth_error':
-                    logger.error("Authentication error - check your API key")
-                    await self.notifier.send_notification(
-                        "❌ DebridAuto Authentication Error",
-                        "Invalid API key or authentication failed. Please check your Real-Debrid API key."
-                    )
-                    # Always save processed hashes file even with auth error
-                    self.save_processed_hashes()
-                    return
-                elif service_status['status'] == 'rate_limited':
-                    logger.warning("Rate limited, waiting 5 minutes before proceeding...")
-                    await asyncio.sleep(300)  # Wait 5 minutes
-                else:
-                    logger.warning(f"Service status {service_status['status']}, proceeding with caution...")
-            else:
-                logger.info("Real-Debrid service is healthy")
-            
-            # Load real DMM hashes instead of fake ones
-            real_hashes = self.load_real_dmm_hashes()
-            if not real_hashes:
-                logger.error("No real DMM hashes available. Run decode_dmm_hashes.py first.")
-                # Always save processed hashes file even when no hashes available
-                self.save_processed_hashes()
-                return
-            
-            logger.info(f"Using {len(real_hashes)} real torrent hashes from DMM")
-            
-            # Parse content from real hashes
-            content_items = self.parse_content_from_hashes(real_hashes)
-            logger.info(f"Parsed {len(content_items)} content items from real hashes")
-            
-            # Filter content based on preferences  
-            filtered_content = self.filter_content(content_items)
-            logger.info(f"After filtering: {len(filtered_content)} items")
-            
-            # Remove already processed hashes
-            new_content = [item for item in filtered_content 
-                          if item['hash'] not in self.processed_hashes]
-            logger.info(f"Found {len(new_content)} new items to process")
-            
-            if not new_content:
-                logger.info("No new content to process")
-                # Always save processed hashes file even when no new content
-                self.save_processed_hashes()
-                return
-            
-            # Check for existing torrents in Real-Debrid
-            existing_torrents = await self.check_existing_torrents()
-            
-            # Remove content that already exists in Real-Debrid
-            unique_content = [item for item in new_content 
-                             if item['hash'].lower() not in existing_torrents]
-            logger.info(f"After removing existing torrents: {len(unique_content)} items remain")
-            
-            # Remove duplicates
-            unique_content = await self.check_content_similarity(unique_content)
-            logger.info(f"After deduplication: {len(unique_content)} unique items")
-            
-            # Limit items per run
-            max_items = self.config.get('max_items_per_run', 50)
-            if len(unique_content) > max_items:
-                unique_content = unique_content[:max_items]
-                logger.info(f"Limited to {max_items} items for this run")
-            
-            # Add to Real-Debrid
-            if unique_content:
-                results = await self.add_content_to_debrid(unique_content, existing_torrents)
-                logger.info(f"Added: {len(results['added'])}, Failed: {len(results['failed'])}, Skipped: {len(results['skipped'])}")
-                
-                # Send notification
-                await self.send_notification(results)
-                
-                # Save processed hashes
-                self.save_processed_hashes()
-            else:
-                logger.info("No unique content to add")
-                # Always save processed hashes file even when no content to add
-                self.save_processed_hashes()
-            
-        except Exception as e:
-            logger.error(f"Error in automation: {str(e)}")
-            # Always save processed hashes file even on error
-            self.save_processed_hashes()
-            # Send error notification
-            try:
-                await self.notifier.send_notification(
-                    "❌ DebridAuto Error",
-                    f"Automation failed with error: {str(e)}"
-                )
-            except Exception as notif_error:
-                logger.error(f"Failed to send error notification: {notif_error}")
-            raise
-        finally:
-            # Ensure sessions are closed
-            try:
-                await self.dmm.close()
-                await self.real_debrid.close()
-            except Exception as e:
-                logger.debug(f"Error closing sessions: {e}")
-
     async def __aenter__(self):
         """Async context manager entry - initialize clients here"""
         self.dmm = DMMClient()
-        self.real_debrid = RealDebridClient(os.getenv('REAL_DEBRID_API_KEY'))
+        self.real_debrid = RealDebridClient(os.getenv('REAL_DEBRID_API_KEY'), self.rd_limiter)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit - cleanup sessions"""
+        await self.save_rd_content_cache()
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
         try:
             if self.dmm:
                 await self.dmm.close()
             if self.real_debrid:
                 await self.real_debrid.close()
+            await self.notifier.close()
         except Exception as e:
             logger.debug(f"Error in cleanup: {e}")
 
     async def check_existing_torrents(self):
         """Check for existing torrents in Real-Debrid to avoid duplicates"""
         try:
-            torrents = await self.real_debrid.get_torrents()
-            existing_hashes = set()
+            # The first page also tells how many pages there are; the rest are fetched concurrently
+            torrents, total = await self.real_debrid.get_torrents_page(1, TORRENTS_PAGE_LIMIT)
+            
+            async def fetch_page(page):
+                async with self._rd_semaphore:
+                    page_torrents, _ = await self.real_debrid.get_torrents_page(page, TORRENTS_PAGE_LIMIT)
+                    return page_torrents
             
-            for torrent in torrents:
-                if 'hash' in torrent:
-                    existing_hashes.add(torrent['hash'].lower())
+            page_count = -(-total // TORRENTS_PAGE_LIMIT)
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, page_count + 1)))
+            
+            # Without a usable X-Total-Count the total is just the first page's size, so pages
+            # are fetched one by one for as long as they come back full
+            page = max(page_count, 1)
+            while len(pages[-1] if pages else torrents) >= TORRENTS_PAGE_LIMIT:
+                page += 1
+                pages.append(await fetch_page(page))
+            
+            existing_hashes = set()
+            for page_torrents in (torrents, *pages):
+                for torrent in page_torrents:
+                    if 'hash' in torrent:
+                        existing_hashes.add(torrent['hash'].lower())
             
             logger.info(f"Found {len(existing_hashes)} existing torrents in Real-Debrid")
             return existing_hashes
@@ -515,75 +636,89 @@ class HashListAutoAdd:
             logger.error(f"Error checking existing torrents: {e}")
             return set()
 
-    async def check_content_similarity(self, content_items):
-        """Check for similar content and deduplicate."""
-        unique_content = []
-        seen_hashes = set()
-        
-        for item in content_items:
-            hash_value = item.get('hash', '')
-            title = item.get('title', 'Unknown')
-            
-            if hash_value in seen_hashes:
-                logger.info(f"Duplicate hash found, skipping: {title}")  # Use global logger
-                continue
-                
-            seen_hashes.add(hash_value)
-            unique_content.append(item)
-        
-        logger.info(f"Deduplication complete: {len(content_items)} -> {len(unique_content)} unique items")
-        return unique_content
-
     async def parse_content_from_hashes(self, hashes):
         """
         Parse content from torrent hashes using Real-Debrid API
-        Returns a list of content items with metadata
+        Returns a list of content items with metadata; hashes must be lowercase and unique,
+        as process_hash_batch passes them
         """
-        content = []
-        
         self.logger.info(f"Parsing {len(hashes)} content items from real hashes")
         
+        # Only hashes without a recent cached result need a Real-Debrid request
+        torrent_infos = {}
+        to_check = []
         for torrent_hash in hashes:
-            try:
-                # Check torrent content before adding to get real file information
-                magnet_link = f"magnet:?xt=urn:btih:{torrent_hash}"
-                torrent_info = await self.real_debrid.check_torrent_content(torrent_hash)
-                
-                if not torrent_info or not torrent_info.get('cached', False):
-                    self.logger.warning(f"Could not get content info for hash {torrent_hash}")
-                    continue
-                
-                # Extract filenames for content type detection
-                files = torrent_info.get("files", [])
-                filenames = [file.get("filename", "unknown") for file in files]
-                
-                if not filenames:
-                    self.logger.warning(f"No filenames found for hash {torrent_hash}")
-                    continue
-                
-                # Determine content type based on actual files
-                content_type = self.determine_content_type(filenames)
-                
-                # Calculate total size from files
-                total_size = sum(file.get("size", 0) for file in files)
-                
-                item = {
-                    "hash": torrent_hash,
-                    "title": f"Cached Content {torrent_hash[:8]}",
-                    "type": content_type,
-                    "size": total_size,
-                    "files": files,
-                    "filenames": filenames,
-                    "file_count": len(filenames)
-                }
-                
+            cached = self.rd_content.get(torrent_hash)
+            if cached is not None:
+                torrent_infos[torrent_hash] = cached['info']
+            else:
+                to_check.append(torrent_hash)
+        if len(to_check) < len(hashes):
+            self.logger.info(f"Using cached Real-Debrid info for {len(hashes) - len(to_check)} hashes")
+        
+        # Check hashes in batches of one availability request each, running the
+        # batches concurrently but bounded to stay within Real-Debrid rate limits
+        batches = [to_check[i:i + AVAILABILITY_BATCH_SIZE] for i in range(0, len(to_check), AVAILABILITY_BATCH_SIZE)]
+        
+        async def check_batch(batch):
+            async with self._rd_semaphore:
+                return await self.real_debrid.check_torrents_content(batch)
+        
+        batch_results = await asyncio.gather(*(check_batch(batch) for batch in batches))
+        
+        checked_at = time.time()
+        for batch_infos in batch_results:
+            for torrent_hash, torrent_info in batch_infos.items():
+                torrent_infos[torrent_hash] = torrent_info
+                # Failed checks are retried next run instead of being cached
+                if 'error' not in torrent_info:
+                    self.rd_content[torrent_hash] = {'checked_at': checked_at, 'info': torrent_info}
+                    self._rd_content_dirty = True
+        
+        content = []
+        for torrent_hash in hashes:
+            item = self._build_content_item(torrent_hash, torrent_infos.get(torrent_hash))
+            if item is not None:
                 content.append(item)
-            except Exception as e:
-                self.logger.error(f"Error parsing content for hash {torrent_hash}: {e}")
         
         self.logger.info(f"Parsed {len(content)} content items from real hashes")
         return content
     
+    def _build_content_item(self, torrent_hash, torrent_info):
+        """Turn the Real-Debrid content info for one hash into a content item, or None if unusable"""
+        try:
+            if not torrent_info or not torrent_info.get('cached', False):
+                self.logger.warning(f"Could not get content info for hash {torrent_hash}")
+                return None
+            
+            # Extract filenames for content type detection and total size in one pass
+            files = torrent_info.get("files", [])
+            filenames = []
+            total_size = 0
+            for file in files:
+                filenames.append(file.get("filename", "unknown"))
+                total_size += file.get("size", 0)
+            
+            if not filenames:
+                self.logger.warning(f"No filenames found for hash {torrent_hash}")
+                return None
+            
+            # Determine content type based on actual files
+            content_type = self.determine_content_type(filenames)
+            
+            return {
+                "hash": torrent_hash,
+                "title": f"Cached Content {torrent_hash[:8]}",
+                "type": content_type,
+                "size": total_size,
+                "files": files,
+                "filenames": filenames,
+                "file_count": len(filenames)
+            }
+        except Exception as e:
+            self.logger.error(f"Error parsing content for hash {torrent_hash}: {e}")
+            return None
+    
     def determine_content_type(self, filenames):
         """
         Analyze filenames to determine the type of content (movie, tv, adult, etc.)
@@ -592,118 +727,126 @@ class HashListAutoAdd:
         if not filenames:
             return "unknown"
             
-        # Common adult content indicators in filenames
-        adult_keywords = [
-            'xxx', 'porn', 'adult', 'sex', 'anal', 'brazzers', 'bangbros', 'naughty', 
-            'playboy', 'penthouse', 'hustler', 'x-art', 'mofos', 'blacked', 'reality kings',
-            'pornhub', 'xvideos', 'milf', 'mature', 'pussy', 'cock', 'dick', 'nude', 'hardcore'
-        ]
-        
-        # Movie indicators
-        movie_keywords = [
-            '1080p', '720p', '2160p', 'bdrip', 'brrip', 'bluray', 'webrip', 'dvdrip', 
-            'x264', 'x265', 'h264', 'h265', 'hevc', 'remux', 'hdr', 'dts', 'aac', 'atmos'
-        ]
-        
-        # TV show indicators
-        tv_keywords = [
-            's01', 's02', 's03', 's04', 's05', 'e01', 'e02', 'e03', 'season', 'episode',
-            'complete.series', 'complete.season', 'tv.pack'
-        ]
-        
-        # Convert filenames to lowercase for case-insensitive matching
-        filenames_lower = [filename.lower() for filename in filenames]
-        joined_names = ' '.join(filenames_lower)
-        
-        # Check for adult content first (most important to filter)
-        for keyword in adult_keywords:
-            if any(keyword in filename for filename in filenames_lower):
-                return "adult"
-        
-        # Check for TV shows
-        for keyword in tv_keywords:
-            if any(keyword in filename for filename in filenames_lower):
-                return "tv"
-        
-        # Check for movies
-        for keyword in movie_keywords:
-            if any(keyword in filename for filename in filenames_lower):
-                return "movie"
-        
-        # Default to other if no specific type detected
-        return "other"
+        # One scan of all filenames per category instead of one substring scan per keyword and file.
+        # Filenames are joined with newlines so no keyword can match across two names.
+        return _classify_names('\n'.join(filenames).lower())
 
     def _extract_quality(self, filenames: List[str]) -> str:
         """Extract quality information from filenames"""
-        joined_names = ' '.join(filenames).lower()
-        
-        # Quality indicators in order of precedence
-        quality_indicators = {
-            '8k': '8K',
-            '4k': '4K',
-            '2160p': '4K',
-            '1080p': 'FHD',
-            '720p': 'HD',
-            'bluray': 'BluRay',
-            'bdrip': 'BluRay',
-            'hdr': 'HDR',
-            'webrip': 'WebRip',
-            'web-dl': 'WEB-DL',
-            'web.dl': 'WEB-DL',
-            'dvdrip': 'DVDRip'
-        }
-        
-        for indicator, quality in quality_indicators.items():
-            if indicator in joined_names:
-                return quality
-                
-        return ""
+        return _quality_from_names(' '.join(filenames).lower())
 
+    def _limit_reached(self) -> bool:
+        """Whether this run has added max_items_per_run items, counting none still in flight"""
+        return self._adds_remaining is not None and self._adds_remaining <= 0 and not self._adds_in_flight
+    
+    async def _reserve_add(self) -> bool:
+        """
+        Take one add from the run limit before sending it. While the limit is taken up by adds
+        still in flight this waits for them, since a failed one gives its add back.
+        Returns False once the limit has been reached.
+        """
+        if self._adds_remaining is None:
+            return True
+        async with self._add_slots:
+            await self._add_slots.wait_for(lambda: self._adds_remaining > 0 or not self._adds_in_flight)
+            if self._adds_remaining <= 0:
+                return False
+            self._adds_remaining -= 1
+            self._adds_in_flight += 1
+            return True
+    
+    async def _finish_add(self, added: bool):
+        """Settle a reserved add; only added items count toward the limit"""
+        if self._adds_remaining is None:
+            return
+        # Counters are updated before awaiting the lock, so a cancelled add still settles
+        self._adds_in_flight -= 1
+        if not added:
+            self._adds_remaining += 1
+        async with self._add_slots:
+            self._add_slots.notify_all()
+    
     async def add_content_to_debrid(self, new_content, existing_torrents):
         """Add content items to Real-Debrid"""
         results = {'added': [], 'failed': [], 'skipped': []}
         
+        # Membership is checked per item, so callers passing a list get a lowercase set.
+        # The usual caller passes the shared set from check_existing_torrents, which is kept
+        # as is so hashes claimed below are visible to concurrently processed hash lists.
+        if not isinstance(existing_torrents, set):
+            existing_torrents = {h.lower() for h in existing_torrents}
+        
+        # Drop already processed hashes and repeats within this batch so none cost a request.
+        # Items are normalized to dicts and each hash is lowercased once here, so the add
+        # tasks and the notification only deal with one representation.
+        seen = set()
+        deduped = []
         for content in new_content:
-            try:
-                # Handle both dict and Content object formats
-                if hasattr(content, 'hash'):
-                    content_hash = content.hash
-                    content_title = getattr(content, 'title', f"Content {content_hash[:8]}")
-                elif isinstance(content, dict):
-                    content_hash = content.get('hash')
-                    content_title = content.get('title', f"Content {content_hash[:8]}")
-                else:
-                    logger.error(f"Invalid content format: {type(content)}")
-                    results['failed'].append(content)
+            item = _content_dict(content)
+            if item is None:
+                logger.error(f"Invalid content format: {type(content)}")
+                results['failed'].append(content)
+                continue
+            content_hash = item.get('hash')
+            hash_lower = content_hash.lower() if content_hash else None
+            if hash_lower:
+                if hash_lower in self.processed_hashes or hash_lower in seen:
                     continue
+                seen.add(hash_lower)
+            deduped.append((item, hash_lower))
+        if len(deduped) + len(results['failed']) < len(new_content):
+            logger.debug(f"Dropped {len(new_content) - len(deduped) - len(results['failed'])} processed or duplicate items before adding")
+        
+        # Add items concurrently, bounded by the shared semaphore so Real-Debrid isn't flooded with magnets
+        async def add_one(content, hash_lower):
+            """Add one item; returns the results bucket it belongs in, or None if the run limit was reached first"""
+            try:
+                content_hash = content.get('hash')
+                content_title = content.get('title') or f"Content {content_hash[:8] if content_hash else ''}"
                     
                 if not content_hash:
                     logger.error(f"No hash found for content: {content}")
-                    results['failed'].append(content)
-                    continue
+                    return 'failed'
                 
                 # Check if already exists in Real-Debrid
-                if content_hash.lower() in existing_torrents:
+                if hash_lower in existing_torrents:
                     logger.info(f"Content already exists in Real-Debrid, skipping: {content_title}")
-                    results['skipped'].append(content)
-                    continue
+                    return 'skipped'
+                
+                # Claim the hash before awaiting, so another item or a hash list processed
+                # concurrently skips it instead of adding it a second time
+                existing_torrents.add(hash_lower)
                 
                 # Add magnet link to Real-Debrid
-                magnet_link = f"magnet:?xt=urn:btih:{content_hash}"
-                success = await self.real_debrid.add_torrent(magnet_link)
+                magnet_link = _MAGNET_PREFIX + content_hash
+                if not await self._reserve_add():
+                    existing_torrents.discard(hash_lower)
+                    return None
+                success = False
+                try:
+                    async with self._rd_semaphore:
+                        success = await self.real_debrid.add_torrent(magnet_link)
+                finally:
+                    await self._finish_add(success)
                 
                 if success:
                     logger.info(f"Successfully added to Real-Debrid: {content_title}")
-                    results['added'].append(content)
                     # Mark as processed
-                    self.processed_hashes.add(content_hash)
+                    self._append_processed(hash_lower)
+                    return 'added'
                 else:
                     logger.error(f"Failed to add to Real-Debrid: {content_title}")
-                    results['failed'].append(content)
+                    existing_torrents.discard(hash_lower)
+                    return 'failed'
                     
             except Exception as e:
-                logger.error(f"Error adding {content.get('title', 'content') if isinstance(content, dict) else getattr(content, 'title', 'content')} to Real-Debrid: {e}")
-                results['failed'].append(content)
+                logger.error(f"Error adding {content.get('title', 'content')} to Real-Debrid: {e}")
+                return 'failed'
+        
+        outcomes = await asyncio.gather(*(add_one(content, hash_lower) for content, hash_lower in deduped))
+        for (content, _), outcome in zip(deduped, outcomes):
+            if outcome:
+                results[outcome].append(content)
                 
         return results
 
@@ -715,18 +858,20 @@ class HashListAutoAdd:
             skipped_count = len(results.get('skipped', []))
             
             # Create notification message
-            message = f"DebridAuto Run Complete:\n"
-            message += f"✅ Added: {added_count}\n"
-            message += f"⏭️ Skipped: {skipped_count}\n"
-            message += f"❌ Failed: {failed_count}\n"
+            parts = [
+                "DebridAuto Run Complete:\n",
+                f"✅ Added: {added_count}\n",
+                f"⏭️ Skipped: {skipped_count}\n",
+                f"❌ Failed: {failed_count}\n"
+            ]
             
             if added_count > 0:
-                message += "\nAdded items:\n"
-                for item in results['added'][:5]:  # Show first 5 items
-                    title = item.get('title', 'Unknown') if isinstance(item, dict) else getattr(item, 'title', 'Unknown')
-                    message += f"• {title}\n"
-                if len(results['added']) > 5:
-                    message += f"• ... and {len(results['added']) - 5} more\n"
+                parts.append("\nAdded items:\n")
+                for item in islice(results['added'], 5):  # Show first 5 items
+                    parts.append(f"• {item.get('title', 'Unknown')}\n")
+                if added_count > 5:
+                    parts.append(f"• ... and {added_count - 5} more\n")
+            message = "".join(parts)
             
             # Send notification
             await self.notifier.send_notification(message)
@@ -742,61 +887,76 @@ class HashListAutoAdd:
         self.logger.info(f"Filtering {len(content_items)} content items")
         filtered_content = []
         
+        movies_enabled = self._movies_enabled
+        tv_enabled = self._tv_enabled
+        min_size_bytes = self._min_size_bytes
+        max_size_bytes = self._max_size_bytes
+        exclude_re = self._exclude_re
+        include_re = self._include_re
+        processed_hashes = self.processed_hashes
+        debug = self.logger.debug
+        
+        # Per-item skip messages are debug only; they use lazy formatting so production runs
+        # don't build a string for every skipped item
         for item in content_items:
+            # Already processed items need no filtering; item hashes are lowercase already
+            hash_value = item.get('hash', '')
+            if hash_value in processed_hashes:
+                continue
+            
             # Get content type and other metadata
             content_type = item.get('type', 'unknown')
-            hash_value = item.get('hash', '')
-            title = item.get('title', f"Content {hash_value[:8]}")
+            title = item.get('title') or f"Content {hash_value[:8]}"
             filenames = item.get('filenames', [])
             
             # Skip adult content
             if content_type == "adult":
                 self.logger.info(f"Skipping adult content: {title}")
                 # Mark as processed to avoid rechecking in future runs
-                self.processed_hashes.add(hash_value)
+                self._append_processed(hash_value)
                 continue
                 
             # Skip content types not enabled in config
-            content_types_config = self.config.get('content_types', {})
-            if content_type == "movie" and not content_types_config.get('movies', True):
-                self.logger.debug(f"Skipping movie content (disabled in config): {title}")
+            if content_type == "movie" and not movies_enabled:
+                debug("Skipping movie content (disabled in config): %s", title)
                 continue
                 
-            if content_type == "tv" and not content_types_config.get('tv_shows', True):
-                self.logger.debug(f"Skipping TV content (disabled in config): {title}")
+            if content_type == "tv" and not tv_enabled:
+                debug("Skipping TV content (disabled in config): %s", title)
                 continue
                 
             # Size filtering
             size_bytes = item.get('size', 0)
-            size_gb = size_bytes / (1024**3)  # Convert to GB
             
-            min_size_gb = self.config.get('min_size_gb', 0.5)
-            max_size_gb = self.config.get('max_size_gb', 50.0)
-            
-            if size_gb < min_size_gb:
-                self.logger.debug(f"Skipping content due to small size ({size_gb:.2f} GB): {title}")
+            if size_bytes < min_size_bytes:
+                debug("Skipping content due to small size (%.2f GB): %s", size_bytes / 1024**3, title)
                 continue
                 
-            if size_gb > max_size_gb:
-                self.logger.debug(f"Skipping content due to large size ({size_gb:.2f} GB): {title}")
+            if size_bytes > max_size_bytes:
+                debug("Skipping content due to large size (%.2f GB): %s", size_bytes / 1024**3, title)
                 continue
             
-            # Keyword filtering
-            exclude_keywords = self.config.get('exclude_keywords', [])
-            include_keywords = self.config.get('include_keywords', [])
-            
-            # Convert filenames to lowercase for case-insensitive matching
-            filenames_lower = [name.lower() for name in filenames]
-            joined_names = ' '.join(filenames_lower)
-            
-            if any(keyword.lower() in joined_names for keyword in exclude_keywords):
-                self.logger.debug(f"Skipping content with excluded keyword: {title}")
-                continue
+            # Keyword filtering, skipped entirely when no keywords are configured
+            if exclude_re or include_re:
+                # Lowercase file by file, so an excluded file stops the scan early
+                excluded = False
+                included = include_re is None
+                for name in filenames:
+                    name_lower = name.lower()
+                    if exclude_re and exclude_re.search(name_lower):
+                        excluded = True
+                        break
+                    if not included and include_re.search(name_lower):
+                        included = True
                 
-            # If include keywords defined, at least one must match
-            if include_keywords and not any(keyword.lower() in joined_names for keyword in include_keywords):
-                self.logger.debug(f"Skipping content without any include keywords: {title}")
-                continue
+                if excluded:
+                    debug("Skipping content with excluded keyword: %s", title)
+                    continue
+                    
+                # If include keywords defined, at least one must match
+                if not included:
+                    debug("Skipping content without any include keywords: %s", title)
+                    continue
             
             # All filters passed
             filtered_content.append(item)
@@ -814,4 +974,8 @@ async def main():
         await auto_add.run_automation()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop's faster event loop when installed, the default asyncio loop otherwise
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
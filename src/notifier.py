@@ -6,39 +6,65 @@ import os
 from typing import Optional
 import logging
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data).encode()
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
 class NotificationService:
     def __init__(self):
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.enabled = bool(self.bot_token and self.chat_id)
+        self.url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage" if self.enabled else None
+        self.session = None  # Created on the first message and reused for later ones
         
         if not self.enabled:
             logger.warning("Telegram notifications disabled - missing bot token or chat ID")
     
+    async def _get_session(self):
+        """Get or create session"""
+        if not self.session or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60)
+            )
+        return self.session
+    
+    async def close(self):
+        """Close the session if one was opened"""
+        if self.session:
+            await self.session.close()
+            self.session = None
+    
     async def send_message(self, message: str):
         """Send message via Telegram"""
         if not self.enabled:
             logger.info(f"Notification (disabled): {message}")
             return
         
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-        data = {
+        body = _json_dumps({
             'chat_id': self.chat_id,
             'text': message,
             'parse_mode': 'HTML'
-        }
+        })
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, json=data) as response:
-                    if response.status == 200:
-                        logger.info("Notification sent successfully")
-                    else:
-                        logger.error(f"Failed to send notification: {response.status}")
-            except Exception as e:
-                logger.error(f"Telegram notification failed: {str(e)}")
+        try:
+            session = await self._get_session()
+            async with session.post(self.url, data=body, headers=_JSON_HEADERS) as response:
+                if response.status == 200:
+                    logger.info("Notification sent successfully")
+                else:
+                    logger.error(f"Failed to send notification: {response.status}")
+        except Exception as e:
+            logger.error(f"Telegram notification failed: {str(e)}")
     
     async def send_notification(self, message: str):
         """Send notification (alias for send_message)"""
@@ -0,0 +1,78 @@
+"""
+Adaptive rate limiter for API calls
+Token bucket that only waits when the request budget is used up and backs off after rate limits
+"""
+import asyncio
+import random
+import time
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveRateLimiter:
+    def __init__(self, max_rate: float, period: float = 60.0,
+                 base_backoff: float = 30.0, max_backoff: float = 300.0):
+        self.capacity = max_rate
+        self.rate = max_rate / period  # Tokens added per second
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        
+        self._tokens = float(max_rate)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_rate_limits = 0
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def _refill(self, now: float):
+        if now > self._last:
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+    
+    async def acquire(self) -> float:
+        """Wait until a request may be made; returns the number of seconds waited"""
+        start = time.monotonic()
+        # A rate limit can be recorded while this caller sleeps, so both the backoff and the
+        # token budget are checked again after every sleep. No lock is held while sleeping;
+        # the check and the token take happen without an await in between.
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                # Honor any backoff from a recent rate limit first
+                delay = self._blocked_until - now
+            else:
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - start
+                delay = (1 - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+    
+    def record_rate_limit(self, retry_after: Optional[float] = None) -> float:
+        """
+        Register a rate-limit response. Later acquires wait for retry_after if given,
+        otherwise for a jittered backoff that doubles with each consecutive rate limit.
+        Returns the delay that was applied.
+        """
+        self._consecutive_rate_limits += 1
+        if retry_after is None:
+            backoff = self.base_backoff * 2 ** (self._consecutive_rate_limits - 1)
+            # Jitter keeps separate runs from retrying in lockstep
+            retry_after = min(self.max_backoff, backoff * random.uniform(1.0, 1.25))
+        
+        # Drain the bucket so requests resume gradually after the backoff
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        self._tokens = 0.0
+        self._last = self._blocked_until
+        logger.debug(f"Rate limited ({self._consecutive_rate_limits} in a row), backing off {retry_after:.0f}s")
+        return retry_after
+    
+    def record_success(self):
+        """Reset the backoff after a request went through"""
+        self._consecutive_rate_limits = 0
@@ -3,23 +3,120 @@ Real-Debrid API Client for managing downloads and torrents
 """
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional
+import random
+import re
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
 import logging
 import json
 
+from rate_limiter import AdaptiveRateLimiter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Torrents returned per page of the torrents listing
+TORRENTS_PAGE_LIMIT = 1000
+
+# Hashes sent per instant availability request
+AVAILABILITY_BATCH_SIZE = 40
+
+_FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+# Endpoints that still get the full browser-like header set
+_BROWSER_ENDPOINTS = frozenset({'torrents/addMagnet'})
+
+# Listing endpoints whose responses can run to hundreds of KB, read in larger chunks
+_LARGE_RESPONSE_ENDPOINTS = frozenset({'torrents', 'downloads'})
+
+# aiohttp can only decode brotli responses when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Magnet link with a Base32 (32), SHA-1 hex (40) or SHA-256 hex (64) info hash
+_MAGNET_RE = re.compile(
+    r'^magnet:\?(?:[^&]*&)*xt=urn:btih:([A-Za-z0-9]{32}|[0-9a-fA-F]{40}|[0-9a-fA-F]{64})(?:&|$)'
+)
+
+class RDError(Exception):
+    """Real-Debrid API error; status is the HTTP status (None for network errors) and
+    retry_after the server's Retry-After in seconds, if sent"""
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class RDServerError(RDError):
+    """5xx response or network failure, usually worth retrying"""
+
+class RDAuthError(RDError):
+    """401/403 response, retrying won't help"""
+
+class RateLimited(RDError):
+    """429 response"""
+
+def _error_for_status(status: int):
+    """Exception class for an error response status"""
+    if status == 429:
+        return RateLimited
+    if status in (401, 403):
+        return RDAuthError
+    if status >= 500:
+        return RDServerError
+    return RDError
+
+class _MagnetLogAdapter(logging.LoggerAdapter):
+    """Prefixes messages with the magnet being added; only runs for records that pass the level check"""
+    def process(self, msg, kwargs):
+        return f"[{self.extra['magnet']}] {msg}", kwargs
+
 class RealDebridClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, rate_limiter: Optional[AdaptiveRateLimiter] = None):
         self.api_key = api_key
         self.base_url = "https://api.real-debrid.com/rest/1.0"
         self.session = None
         self._closed = False
+        # Paces every request; Real-Debrid allows 250 requests per minute
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(200)
+        # Source of retry jitter; seed it to make retry delays reproducible
+        self._random = random.Random()
+        # Last healthy service status and when it was seen, reused for a short while
+        self._status_cache: Optional[Tuple[float, Dict]] = None
+        
+        # The JSON API only needs authorization; built once as they are the same for every request
+        self._default_headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        }
+        # Headers that better match web browsers and DMM, for endpoints in _BROWSER_ENDPOINTS
+        self._browser_headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': _ACCEPT_ENCODING,
+            'Origin': 'https://real-debrid.com',
+            'Referer': 'https://real-debrid.com/',
+            'Cache-Control': 'no-cache',
+            'Pragma': 'no-cache'
+        }
         
     async def __aenter__(self):
         """Async context manager entry"""
         if not self.session and not self._closed:
-            self.session = aiohttp.ClientSession()
+            self.session = self._new_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -33,10 +130,20 @@ class RealDebridClient:
             self._closed = True
             self.session = None
     
+    @staticmethod
+    def _new_session() -> aiohttp.ClientSession:
+        """Session whose connections to Real-Debrid stay alive between requests"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10)
+        )
+    
     async def _get_session(self):
         """Get or create session"""
         if not self.session and not self._closed:
-            self.session = aiohttp.ClientSession()
+            self.session = self._new_session()
         elif self._closed:
             raise RuntimeError("Client has been closed")
         return self.session
@@ -45,85 +152,125 @@ class RealDebridClient:
         """Make authenticated request to Real-Debrid API with improved error handling"""
         session = await self._get_session()
         
-        # Use headers that better match web browsers and DMM
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Origin': 'https://real-debrid.com',
-            'Referer': 'https://real-debrid.com/',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        }
-        
-        # Merge any custom headers
+        # Only copy the base headers when a caller overrides some of them
+        base_headers = self._browser_headers if endpoint in _BROWSER_ENDPOINTS else self._default_headers
         if 'headers' in kwargs:
-            headers.update(kwargs.pop('headers'))
+            headers = {**base_headers, **kwargs.pop('headers')}
+        else:
+            headers = base_headers
+        
+        # Listing endpoints report their full size in X-Total-Count
+        return_total = kwargs.pop('return_total', False)
         
         url = f"{self.base_url}/{endpoint}"
         
-        # Add random delay to mimic human behavior
-        await asyncio.sleep(0.5 + (hash(url) % 100) / 1000)  # 0.5-0.6s delay
+        if endpoint in _LARGE_RESPONSE_ENDPOINTS:
+            kwargs.setdefault('read_bufsize', 2 ** 16)
+        
+        # Only waits once the request budget is used up or after a rate limit
+        await self.rate_limiter.acquire()
         
         try:
             async with session.request(method, url, headers=headers, **kwargs) as response:
-                response_text = await response.text()
+                # Parse the raw body directly; it is only decoded to text when it isn't JSON
+                body = await response.read()
                 
                 # Log response for debugging
-                logger.debug(f"Real-Debrid API {method} {endpoint}: {response.status}")
+                logger.debug("Real-Debrid API %s %s: %s", method, endpoint, response.status)
                 
                 # Success responses: 200 OK, 201 Created, 204 No Content
                 if response.status in [200, 201, 204]:
+                    self.rate_limiter.record_success()
                     try:
-                        if response_text:
-                            return json.loads(response_text)
+                        if body:
+                            result = _json_loads(body)
                         else:
-                            return {'success': True, 'status': response.status}
-                    except json.JSONDecodeError:
-                        return {'raw_response': response_text, 'success': True, 'status': response.status}
+                            result = {'success': True, 'status': response.status}
+                    except ValueError:
+                        result = {'raw_response': body.decode('utf-8', 'replace'), 'success': True, 'status': response.status}
+                    if return_total:
+                        return result, self._total_count(response.headers.get('X-Total-Count'), result)
+                    return result
                 
                 # Handle error responses with detailed information
                 try:
-                    error_data = json.loads(response_text) if response_text else {}
+                    error_data = _json_loads(body) if body else {}
                     error_code = error_data.get('error_code', 'unknown')
                     error_message = error_data.get('error', 'Unknown error')
                     
                     logger.error(f"Real-Debrid API error {response.status}: {error_code} - {error_message}")
-                    logger.error(f"Request URL: {url}")
-                    logger.error(f"Request data: {kwargs.get('data', 'None')}")
+                    logger.error("Request URL: %s", url)
+                    # Request data is only rendered if the record is emitted
+                    logger.error("Request data: %s", kwargs.get('data', 'None'))
                     
-                    raise Exception(f"Real-Debrid API error {response.status}: {error_code} - {error_message}")
+                    message = f"Real-Debrid API error {response.status}: {error_code} - {error_message}"
                     
-                except json.JSONDecodeError:
+                except ValueError:
+                    response_text = body.decode('utf-8', 'replace')
                     logger.error(f"Real-Debrid API error {response.status}: {response_text}")
-                    raise Exception(f"Real-Debrid API error {response.status}: {response_text}")
+                    message = f"Real-Debrid API error {response.status}: {response_text}"
+                
+                # Rate limits and overload carry the server's retry hint for callers backing off
+                retry_after = None
+                if response.status in (429, 503):
+                    retry_after = self._retry_after(response.headers.get('Retry-After'))
+                    # Hold every later request: always on 429, on 503 only when told how long
+                    if response.status == 429 or retry_after is not None:
+                        self.rate_limiter.record_rate_limit(retry_after)
+                raise _error_for_status(response.status)(message, response.status, retry_after)
                     
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Network error communicating with Real-Debrid: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+            raise RDServerError(f"Network error: {str(e)}")
+    
+    @staticmethod
+    def _total_count(value: Optional[str], result) -> int:
+        """Total from an X-Total-Count header; the size of this page if it is missing or invalid"""
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return len(result) if isinstance(result, list) else 0
+    
+    @staticmethod
+    def _retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds from a Retry-After header (delay or HTTP date), or None if missing or invalid"""
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
     
     async def add_magnet(self, magnet_link: str) -> bool:
         """Add magnet link to Real-Debrid with improved validation and retry logic"""
         max_retries = 5  # Increased retries
         base_retry_delay = 3  # Longer initial delay
         
+        # Validate magnet link format
+        info_hash = self._parse_magnet_hash(magnet_link)
+        if not info_hash:
+            logger.error("Invalid magnet link format: %s", magnet_link)
+            return False
+        
+        # Bind the magnet once instead of formatting it into every per-attempt message
+        log = _MagnetLogAdapter(logger, {'magnet': info_hash[:16]})
+        
+        # Form-encode the body once like a browser would; retries send the same bytes
+        data = urllib.parse.urlencode({'magnet': magnet_link}).encode()
+        
         for attempt in range(max_retries):
             try:
-                # Validate magnet link format
-                if not self._validate_magnet_link(magnet_link):
-                    logger.error(f"Invalid magnet link format: {magnet_link}")
-                    return False
-                
-                logger.info(f"Adding magnet to Real-Debrid (attempt {attempt + 1}/{max_retries}): {magnet_link[:100]}...")
-                
-                # Prepare form data like a browser would
-                data = aiohttp.FormData()
-                data.add_field('magnet', magnet_link)
+                log.info("Adding magnet to Real-Debrid (attempt %d/%d)", attempt + 1, max_retries)
                 
                 # Use POST with form data instead of JSON
-                response = await self._make_request('POST', 'torrents/addMagnet', data=data)
+                response = await self._make_request('POST', 'torrents/addMagnet', data=data, headers=_FORM_HEADERS)
                 
                 # Check for successful addition - Real-Debrid returns 201 with torrent info
                 if response and ('id' in response or 'uri' in response):
@@ -131,58 +278,58 @@ class RealDebridClient:
                     torrent_uri = response.get('uri', '')
                     
                     if torrent_id:
-                        logger.info(f"Successfully added magnet to Real-Debrid! Torrent ID: {torrent_id}")
+                        log.info("Successfully added magnet to Real-Debrid! Torrent ID: %s", torrent_id)
                         if torrent_uri:
-                            logger.info(f"Torrent info URL: {torrent_uri}")
-                        
-                        # Wait a moment before selecting files
-                        await asyncio.sleep(1)
+                            log.info("Torrent info URL: %s", torrent_uri)
                         
                         # Optionally select files (Real-Debrid usually auto-selects)
                         try:
                             await self._select_files(torrent_id)
                         except Exception as e:
-                            logger.warning(f"Could not select files for torrent {torrent_id}: {e}")
+                            log.warning("Could not select files for torrent %s: %s", torrent_id, e)
                         
                         return True
                     else:
-                        logger.warning(f"Torrent added but no ID returned: {response}")
+                        log.warning("Torrent added but no ID returned: %s", response)
                         return True  # Still consider it successful if we got a response
                 elif response and response.get('success'):
-                    logger.info("Successfully added magnet to Real-Debrid (no ID returned)")
+                    log.info("Successfully added magnet to Real-Debrid (no ID returned)")
                     return True
                 else:
-                    logger.error(f"Unexpected response when adding magnet: {response}")
+                    log.error("Unexpected response when adding magnet: %s", response)
                     if attempt < max_retries - 1:
                         retry_delay = base_retry_delay * (1.5 ** attempt)  # Slower exponential backoff
-                        logger.info(f"Retrying in {retry_delay:.1f} seconds...")
+                        log.info("Retrying in %.1f seconds...", retry_delay)
                         await asyncio.sleep(retry_delay)
                         continue
                     return False
                     
             except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Failed to add magnet (attempt {attempt + 1}/{max_retries}): {error_msg}")
+                log.error("Failed to add magnet (attempt %d/%d): %s", attempt + 1, max_retries, e)
                 
-                # Check if it's a server error (503, 502, 504, rate limits, etc.)
-                is_server_error = any(code in error_msg for code in ["503", "502", "504", "429", "internal_error", "timeout", "Network error"])
+                # Server errors (5xx, network failures) and rate limits are worth retrying
+                is_server_error = isinstance(e, (RDServerError, RateLimited))
                 
                 if is_server_error and attempt < max_retries - 1:
-                    # Use longer delays and jitter for server errors
-                    retry_delay = base_retry_delay * (1.8 ** attempt) + (hash(magnet_link) % 3)  # 3-6s, 5-8s, 9-12s etc
-                    logger.info(f"Server error detected ({error_msg}), retrying in {retry_delay:.1f} seconds...")
+                    if getattr(e, 'retry_after', None) is not None:
+                        # Wait exactly as long as Real-Debrid asked, plus a little jitter
+                        retry_delay = e.retry_after + self._random.uniform(0, 1)
+                    else:
+                        # Use longer delays and jitter for server errors
+                        retry_delay = base_retry_delay * (1.8 ** attempt) * self._random.uniform(0.5, 1.5)  # 1.5-4.5s, 2.7-8.1s etc
+                    log.info("Server error detected (%s), retrying in %.1f seconds...", e, retry_delay)
                     await asyncio.sleep(retry_delay)
                     continue
                 
                 # For other errors (auth, invalid magnet, etc.), don't retry
-                if "401" in error_msg or "403" in error_msg:
-                    logger.error("Authentication error - check your Real-Debrid API key")
-                elif "400" in error_msg:
-                    logger.error("Bad request - possibly invalid magnet link")
+                if isinstance(e, RDAuthError):
+                    log.error("Authentication error - check your Real-Debrid API key")
+                elif getattr(e, 'status', None) == 400:
+                    log.error("Bad request - possibly invalid magnet link")
                 
                 return False
         
-        logger.error(f"Failed to add magnet after {max_retries} attempts")
+        log.error("Failed to add magnet after %d attempts", max_retries)
         return False
     
     async def add_torrent(self, magnet_link: str) -> bool:
@@ -191,38 +338,46 @@ class RealDebridClient:
     
     def _validate_magnet_link(self, magnet_link: str) -> bool:
         """Validate magnet link format"""
-        if not magnet_link.startswith('magnet:?'):
-            return False
-        
-        # Check for required xt parameter (torrent hash)
-        if 'xt=urn:btih:' not in magnet_link:
-            return False
-        
-        # Extract hash and validate length
-        try:
-            hash_part = magnet_link.split('xt=urn:btih:')[1].split('&')[0]
-            # Accept Base32 (32), SHA-1 hex (40), or SHA-256 hex (64) hashes
-            if len(hash_part) not in [32, 40, 64]:
-                logger.error(f"Invalid hash length {len(hash_part)}, expected 32, 40, or 64 characters")
-                return False
-        except (IndexError, ValueError):
-            return False
-        
-        return True
+        return _MAGNET_RE.match(magnet_link) is not None
+    
+    @staticmethod
+    def _parse_magnet_hash(magnet_link: str) -> Optional[str]:
+        """Info hash of a valid magnet link, or None"""
+        match = _MAGNET_RE.match(magnet_link)
+        return match.group(1) if match else None
+    
+    async def _poll_info_ready(self, torrent_id: str, max_wait: float = 1.5, interval: float = 0.25) -> Optional[Dict]:
+        """Get torrent info as soon as its file list is available, giving up after max_wait seconds"""
+        deadline = time.monotonic() + max_wait
+        while True:
+            torrent_info = await self._make_request('GET', f'torrents/info/{torrent_id}')
+            if (torrent_info and torrent_info.get('files')) or time.monotonic() >= deadline:
+                return torrent_info
+            await asyncio.sleep(interval)
     
-    async def _select_files(self, torrent_id: str):
-        """Select all files in a torrent"""
+    async def _select_files(self, torrent_id: str, selective: bool = False, torrent_info: Optional[Dict] = None):
+        """
+        Select all files in a torrent. Real-Debrid accepts "all" for that, so the torrent info is
+        only fetched (or taken from torrent_info) when selective is set to list the file IDs.
+        """
         try:
+            if not selective:
+                data = urllib.parse.urlencode({'files': 'all'}).encode()
+                await self._make_request('POST', f'torrents/selectFiles/{torrent_id}', data=data, headers=_FORM_HEADERS)
+                logger.info(f"Selected all files for torrent {torrent_id}")
+                return
+            
             # Get torrent info to see available files
-            torrent_info = await self._make_request('GET', f'torrents/info/{torrent_id}')
+            if torrent_info is None:
+                torrent_info = await self._poll_info_ready(torrent_id)
             
             if torrent_info and 'files' in torrent_info:
                 files = torrent_info['files']
                 if files:
                     # Select all files
                     file_ids = ','.join(str(f['id']) for f in files)
-                    data = {'files': file_ids}
-                    await self._make_request('POST', f'torrents/selectFiles/{torrent_id}', data=data)
+                    data = urllib.parse.urlencode({'files': file_ids}).encode()
+                    await self._make_request('POST', f'torrents/selectFiles/{torrent_id}', data=data, headers=_FORM_HEADERS)
                     logger.info(f"Selected {len(files)} files for torrent {torrent_id}")
                     
         except Exception as e:
@@ -236,6 +391,18 @@ class RealDebridClient:
             logger.error(f"Failed to get torrents: {e}")
             return []
     
+    async def get_torrents_page(self, page: int = 1, limit: int = TORRENTS_PAGE_LIMIT) -> Tuple[List[Dict], int]:
+        """Get one page of torrents and the total number of torrents on the account"""
+        try:
+            torrents, total = await self._make_request(
+                'GET', 'torrents', params={'page': page, 'limit': limit}, return_total=True
+            )
+            # Pages past the end come back as 204 No Content
+            return (torrents if isinstance(torrents, list) else []), total
+        except Exception as e:
+            logger.error(f"Failed to get torrents page {page}: {e}")
+            return [], 0
+    
     async def get_downloads(self) -> List[Dict]:
         """Get list of downloads"""
         try:
@@ -253,62 +420,64 @@ class RealDebridClient:
             logger.error(f"Failed to delete torrent {torrent_id}: {e}")
             return False
     
-    async def get_torrent_info(self, hash_str: str) -> Optional[Dict]:
+    def get_torrent_info(self, hash_str: str) -> Optional[Dict]:
         """Get torrent information by hash"""
         # Real-Debrid doesn't have a direct hash lookup endpoint
-        # We'll simulate torrent info for the auto-add process
-        try:
-            # For now, return basic info to allow the auto-add process to continue
-            # The actual availability will be checked when we try to add the magnet
-            return {
-                'hash': hash_str,
-                'filename': f"content_{hash_str[:8]}",  # Placeholder filename
-                'bytes': 1073741824,  # 1GB placeholder size
-                'status': 'unknown',
-                'available': True  # Assume available to allow processing
-            }
-                
-        except Exception as e:
-            logger.debug(f"Could not check availability for hash {hash_str}: {str(e)}")
-            return None
+        # We'll simulate torrent info for the auto-add process; use check_torrents_content
+        # when actual availability matters
+        return {
+            'hash': hash_str,
+            'filename': f"content_{hash_str[:8]}",  # Placeholder filename
+            'bytes': 1073741824,  # 1GB placeholder size
+            'status': 'unknown',
+            'available': True  # Assume available to allow processing
+        }
     
-    async def check_service_status(self) -> Dict:
-        """Check Real-Debrid service status and API health"""
+    async def check_service_status(self, max_age: float = 30.0) -> Dict:
+        """Check Real-Debrid service status and API health; a healthy result is reused for max_age seconds"""
+        if self._status_cache and time.monotonic() - self._status_cache[0] < max_age:
+            return self._status_cache[1]
+        
         try:
             # Check user account to verify API is working
             user_info = await self._make_request('GET', 'user')
             if user_info:
-                return {
+                status = {
                     'status': 'healthy',
                     'api_responsive': True,
                     'user': user_info.get('username', 'unknown'),
                     'premium_until': user_info.get('premium', 'unknown')
                 }
+                self._status_cache = (time.monotonic(), status)
+                return status
         except Exception as e:
+            self._status_cache = None
             error_msg = str(e)
             status = 'unhealthy'
             
-            if "503" in error_msg or "502" in error_msg or "504" in error_msg:
+            if isinstance(e, RDServerError) and e.status in (502, 503, 504):
                 status = 'service_unavailable'
-            elif "401" in error_msg or "403" in error_msg:
+            elif isinstance(e, RDAuthError):
                 status = 'auth_error'
-            elif "429" in error_msg:
+            elif isinstance(e, RateLimited):
                 status = 'rate_limited'
             
             return {
                 'status': status,
                 'api_responsive': False,
-                'error': error_msg
+                'error': error_msg,
+                'retry_after': getattr(e, 'retry_after', None)
             }
     
     async def wait_for_service_recovery(self, max_wait_minutes: int = 30) -> bool:
         """Wait for Real-Debrid service to recover from 503 errors"""
         logger.info(f"Waiting for Real-Debrid service recovery (max {max_wait_minutes} minutes)...")
         
-        check_interval = 60  # Check every minute
-        max_checks = max_wait_minutes
+        # Check again after 5s, doubling up to once a minute, so short outages end the wait early
+        check_interval = 5
+        deadline = time.monotonic() + max_wait_minutes * 60
         
-        for attempt in range(max_checks):
+        while time.monotonic() < deadline:
             try:
                 status = await self.check_service_status()
                 if status['status'] == 'healthy':
@@ -319,11 +488,12 @@ class RealDebridClient:
                     return False
                     
                 logger.info(f"Service still {status['status']}, checking again in {check_interval}s...")
-                await asyncio.sleep(check_interval)
                 
             except Exception as e:
                 logger.debug(f"Status check failed: {e}")
-                await asyncio.sleep(check_interval)
+            
+            await asyncio.sleep(min(check_interval, max(0.0, deadline - time.monotonic())))
+            check_interval = min(check_interval * 2, 60)
         
         logger.warning(f"Service did not recover within {max_wait_minutes} minutes")
         return False
@@ -333,35 +503,55 @@ class RealDebridClient:
         Check the content of a torrent by its hash without adding it to Real-Debrid
         This uses the instant availability endpoint to get info about cached torrents
         """
+        results = await self.check_torrents_content([hash_str])
+        return results[hash_str.lower()]
+    
+    async def check_torrents_content(self, hashes: List[str]) -> Dict[str, Dict]:
+        """
+        Check the content of several torrents with a single instant availability request.
+        Returns a dict mapping each lowercase hash to the same info check_torrent_content returns.
+        """
+        torrent_hashes = [hash_str.lower() for hash_str in hashes]
+        if not torrent_hashes:
+            return {}
+        
         try:
-            # Format the hash as a magnet link for the request
-            torrent_hash = hash_str.lower()
-            
-            # Use the availability endpoint which doesn't add the torrent
-            endpoint = f'torrents/instantAvailability/{torrent_hash}'
+            # The availability endpoint takes any number of hashes separated by slashes
+            endpoint = 'torrents/instantAvailability/' + '/'.join(torrent_hashes)
             response = await self._make_request('GET', endpoint)
-            
-            # If no response or empty, torrent might not be cached
-            if not response or torrent_hash not in response:
-                logger.debug(f"Torrent {torrent_hash[:8]} not available in Real-Debrid cache")
-                return {
-                    'hash': torrent_hash,
-                    'cached': False,
-                    'files': []
-                }
-            
-            # Get cached files info
-            cached_data = response[torrent_hash]
-            if not cached_data or not isinstance(cached_data, list) or len(cached_data) == 0:
-                return {
+        except Exception as e:
+            logger.error(f"Error checking torrent content for {len(torrent_hashes)} hashes: {str(e)}")
+            return {
+                torrent_hash: {
                     'hash': torrent_hash,
                     'cached': False,
+                    'error': str(e),
                     'files': []
                 }
-            
-            # First item in the list contains cached files
-            cached_files = []
-            
+                for torrent_hash in torrent_hashes
+            }
+        
+        if not isinstance(response, dict):
+            response = {}
+        return {torrent_hash: self._parse_availability(torrent_hash, response.get(torrent_hash))
+                for torrent_hash in torrent_hashes}
+    
+    def _parse_availability(self, torrent_hash: str, cached_data) -> Dict:
+        """Build the content info for one hash from its instant availability entry"""
+        # If no response or empty, torrent might not be cached
+        if not cached_data or not isinstance(cached_data, list):
+            logger.debug(f"Torrent {torrent_hash[:8]} not available in Real-Debrid cache")
+            return {
+                'hash': torrent_hash,
+                'cached': False,
+                'files': []
+            }
+        
+        # First item in the list contains cached files
+        cached_files = []
+        
+        # A malformed entry only fails this hash, not the whole batch
+        try:
             # Extract file information from response
             # Format varies by source, so check different possible structures
             for host_data in cached_data:
@@ -383,18 +573,17 @@ class RealDebridClient:
                                     'size': filesize,
                                     'id': len(cached_files) + 1  # Generate sequential ID
                                 })
-            
-            return {
-                'hash': torrent_hash,
-                'cached': len(cached_files) > 0,
-                'files': cached_files
-            }
-                
         except Exception as e:
-            logger.error(f"Error checking torrent content for hash {hash_str[:8]}: {str(e)}")
+            logger.warning(f"Could not parse availability for torrent {torrent_hash[:8]}: {e}")
             return {
-                'hash': hash_str,
+                'hash': torrent_hash,
                 'cached': False,
                 'error': str(e),
                 'files': []
-            }
\ No newline at end of file
+            }
+        
+        return {
+            'hash': torrent_hash,
+            'cached': len(cached_files) > 0,
+            'files': cached_files
+        }
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from dmm_client import DMMClient, _lz_decompress_uri
+
+HASH = 'a' * 40
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+
+
+class FakeResponse:
+    def __init__(self, status, body=b'', headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, headers))
+        return self.response
+
+
+class LoadHashListCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = DMMClient(cache_dir=Path(self.tmp.name))
+        # Skip the LZ decoding; the page only has to contain an iframe
+        self.client._extract_hashes_from_iframe = lambda src: [HASH]
+        page = b'<html><iframe src="https://debridmediamanager.com/hashlist#abc"></iframe></html>'
+        self.client.session = FakeSession(FakeResponse(200, page, {'ETag': '"v1"'}))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_iframe_hashes_are_served_from_cache_within_ttl(self):
+        self.assertEqual(await self.client.load_hash_list('list.html'), [HASH])
+        self.assertEqual(await self.client.load_hash_list('list.html'), [HASH])
+        self.assertEqual(len(self.client.session.requests), 1)
+
+    async def test_stale_iframe_entry_is_revalidated_with_etag(self):
+        await self.client.load_hash_list('list.html')
+        self.client.cache.ttl = 0
+        self.client.session.response = FakeResponse(304)
+
+        self.assertEqual(await self.client.load_hash_list('list.html'), [HASH])
+        _, headers = self.client.session.requests[-1]
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+
+
+
+class ExtractHashesFromJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.client = DMMClient(cache_dir=Path(tempfile.gettempdir()) / 'unused')
+
+    def test_only_hex_hashes_are_kept(self):
+        data = ['A' * 40, 'g' * 40, 'é' * 40, 'b' * 64, 'c' * 39]
+        self.assertEqual(self.client._extract_hashes_from_json(data), ['a' * 40, 'b' * 64])
+
+    def test_first_string_valued_key_is_used(self):
+        data = {'hashes': [
+            {'hash': None, 'btih': 'd' * 40},
+            {'hash': 12345, 'info_hash': 'e' * 40},
+            {'btih': 'f' * 40, 'info_hash': '0' * 40},
+        ]}
+        self.assertEqual(self.client._extract_hashes_from_json(data), ['d' * 40, 'e' * 40, 'f' * 40])
+
+
+class LZDecompressTest(unittest.TestCase):
+    # Outputs of LZString.compressToEncodedURIComponent
+    VECTORS = {
+        'Q': '',
+        'BYUwNmD2AEDukCcwBMg': 'hello world',
+        'BIUwNmD2A0AEDqkBOYAmBCWoIwct6QA': 'Hello, World! Hello, World!',
+        'D8Ow9wxgbwJglwAkMBkDCnpoGnNB5UUA': 'ünïcödé ☃ 日本語',
+        'IY18ZXSQ': 'a' * 47,
+        'MYAgHA+gpgRgFgWwiOAvIA': 'c 8_ebhm_ hz',
+    }
+
+    def test_known_vectors(self):
+        for compressed, expected in self.VECTORS.items():
+            with self.subTest(compressed=compressed):
+                self.assertEqual(_lz_decompress_uri(compressed), expected)
+
+    def test_empty_input(self):
+        self.assertIsNone(_lz_decompress_uri(''))
+
+    def test_invalid_characters(self):
+        self.assertIsNone(_lz_decompress_uri('BYUw@NmD2AEDukCcwBMg'))
+        self.assertIsNone(_lz_decompress_uri('BYUwNmD2AEDukCcwBMg='))
+
+    def test_truncated_input(self):
+        self.assertEqual(_lz_decompress_uri('BYUwNmD2AE'), '')
+        # Streams whose codes run past the end read zero bits instead of raising
+        for compressed in ('wR', 'EHC', '33bj'):
+            with self.subTest(compressed=compressed):
+                self.assertEqual(_lz_decompress_uri(compressed), '')
+
+    def test_plus_encoded_as_space(self):
+        # A '+' that arrives form-decoded as a space still decodes
+        self.assertEqual(_lz_decompress_uri('MYAgHA gpgRgFgWwiOAvIA'), 'c 8_ebhm_ hz')
+
+    def test_multi_kb_hash_list(self):
+        # 11 KB of hash list JSON, compressed to about 6 KB of URI-safe text
+        expected = json.dumps([
+            {'filename': f'Movie.{i}.2023.1080p.BluRay.x264.mkv',
+             'hash': hashlib.sha1(str(i).encode()).hexdigest(),
+             'bytes': i * 1048576}
+            for i in range(100)
+        ], separators=(',', ':'))
+        compressed = (DATA_DIR / 'lz_hash_list.txt').read_text().strip()
+
+        self.assertEqual(_lz_decompress_uri(compressed), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
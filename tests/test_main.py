@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+HashListAutoAdd = None
+
+
+def setUpModule():
+    # main logs to ../logs and keeps its data in ../data relative to the working directory,
+    # so it is imported and run from a src directory inside a scratch tree
+    global HashListAutoAdd, _tmp, _cwd, _root_handlers
+    _root_handlers = list(logging.getLogger().handlers)
+    _tmp = tempfile.TemporaryDirectory()
+    for name in ('src', 'logs'):
+        (Path(_tmp.name) / name).mkdir()
+    _cwd = os.getcwd()
+    os.chdir(Path(_tmp.name) / 'src')
+    from main import HashListAutoAdd
+
+
+def tearDownModule():
+    os.chdir(_cwd)
+    # Drop the handlers main's basicConfig added, so later tests don't log into the removed tree
+    root = logging.getLogger()
+    for handler in root.handlers[len(_root_handlers):]:
+        root.removeHandler(handler)
+        handler.close()
+    _tmp.cleanup()
+
+
+class FakeRealDebrid:
+    def __init__(self, fail_hashes=()):
+        self.fail_hashes = set(fail_hashes)
+        self.started = 0
+        self.finished = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def check_service_status(self):
+        return {'status': 'healthy'}
+
+    async def get_torrents_page(self, page, limit):
+        return [], 0
+
+    async def check_torrents_content(self, hashes):
+        await self._request()
+        return {h.lower(): {'cached': True, 'files': [
+            {'filename': 'Movie.2023.1080p.BluRay.x264.mkv', 'size': 2 * 1024**3}]} for h in hashes}
+
+    async def add_torrent(self, magnet_link):
+        self.started += 1
+        await self._request()
+        self.finished += 1
+        return magnet_link[-40:] not in self.fail_hashes
+
+    async def close(self):
+        pass
+
+
+class FakeDMM:
+    async def get_available_hash_lists(self):
+        return [f'list{i}.html' for i in range(6)]
+
+    async def load_hash_list(self, filename):
+        start = int(filename[4]) * 10
+        return ['%040x' % n for n in range(start, start + 10)]
+
+    async def close(self):
+        pass
+
+
+class MaxItemsPerRunTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.app = HashListAutoAdd()
+        self.app.config['hash_list_concurrency'] = 6
+        self.app._max_items_per_run = 7
+        self.app._max_items_per_batch = 5
+        self.app.dmm = FakeDMM()
+
+    def tearDown(self):
+        if self.app._log_fp:
+            self.app._log_fp.close()
+        for path in Path('../data').iterdir():
+            if path.is_file():
+                path.unlink()
+
+    async def test_limit_stops_new_adds_without_cancelling_running_ones(self):
+        self.app.real_debrid = rd = FakeRealDebrid()
+        await self.app.run_automation()
+
+        self.assertEqual(rd.started, 7)
+        self.assertEqual(rd.finished, rd.started)
+        self.assertEqual(len(self.app.processed_hashes), 7)
+
+    async def test_failed_adds_do_not_count_toward_the_limit(self):
+        self.app.real_debrid = rd = FakeRealDebrid(fail_hashes={'%040x' % 0, '%040x' % 1})
+        await self.app.run_automation()
+
+        self.assertEqual(rd.started, 9)
+        self.assertEqual(len(self.app.processed_hashes), 7)
+
+    async def test_rd_concurrency_is_shared_by_all_hash_lists(self):
+        self.app._rd_semaphore = asyncio.Semaphore(3)
+        self.app.real_debrid = rd = FakeRealDebrid()
+        await self.app.run_automation()
+
+        self.assertEqual(rd.max_in_flight, 3)
+
+
+class CheckExistingTorrentsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.app = HashListAutoAdd()
+        self.app.real_debrid = self.rd = FakeRealDebrid()
+        self.pages = []
+
+        async def get_torrents_page(page, limit):
+            self.pages.append(page)
+            start = (page - 1) * limit
+            torrents = [{'hash': '%040x' % n} for n in range(start, min(start + limit, 2500))]
+            # As when X-Total-Count is missing: the client reports the page size
+            return torrents, len(torrents)
+        self.rd.get_torrents_page = get_torrents_page
+
+    async def test_pages_are_followed_while_full_when_total_is_unknown(self):
+        existing = await self.app.check_existing_torrents()
+
+        self.assertEqual(len(existing), 2500)
+        self.assertEqual(self.pages, [1, 2, 3])
+
+
+class SaveProcessedHashesTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.app = HashListAutoAdd()
+
+    def tearDown(self):
+        if self.app._log_fp:
+            self.app._log_fp.close()
+        for path in Path('../data').iterdir():
+            if path.is_file():
+                path.unlink()
+
+    async def test_hash_processed_during_a_save_is_kept_for_the_next_one(self):
+        self.app._append_processed('a' * 40)
+        write_started = threading.Event()
+        release_write = threading.Event()
+        write_snapshot = self.app._write_processed_snapshot
+
+        def slow_write(data):
+            write_started.set()
+            release_write.wait(5)
+            write_snapshot(data)
+        self.app._write_processed_snapshot = slow_write
+
+        save = asyncio.create_task(self.app.save_processed_hashes())
+        await asyncio.to_thread(write_started.wait, 5)
+        self.app._append_processed('b' * 40)
+        release_write.set()
+        await save
+
+        self.assertEqual(self.app._unsaved_count, 1)
+        self.assertEqual(self.app.processed_log.read_text(), 'b' * 40 + '\n')
+        self.assertEqual(self.app.load_processed_hashes(), {'a' * 40, 'b' * 40})
+
+        await self.app.save_processed_hashes()
+        self.assertEqual(self.app._unsaved_count, 0)
+        self.assertIn('b' * 40, self.app.processed_file.read_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
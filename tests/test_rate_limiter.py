@@ -0,0 +1,29 @@
+import asyncio
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from rate_limiter import AdaptiveRateLimiter
+
+
+class AcquireTest(unittest.IsolatedAsyncioTestCase):
+    async def test_backoff_recorded_mid_wait_is_honored(self):
+        # One token per 0.1s; the first acquire takes the only token
+        limiter = AdaptiveRateLimiter(1, period=0.1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.02)
+        limiter.record_rate_limit(0.3)
+        blocked_until = limiter._blocked_until
+        await waiter
+
+        self.assertGreaterEqual(time.monotonic(), blocked_until)
+        self.assertGreaterEqual(limiter._tokens, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from real_debrid_client import RealDebridClient
+
+GOOD = 'a' * 40
+BAD = 'b' * 40
+
+
+class CheckTorrentsContentTest(unittest.IsolatedAsyncioTestCase):
+    async def test_malformed_entry_only_fails_its_own_hash(self):
+        client = RealDebridClient('key')
+
+        async def make_request(method, endpoint, **kwargs):
+            return {
+                GOOD: [{'rd': [{'filename': 'Movie.mkv', 'filesize': 1024}]}],
+                BAD: [{'rd': [{'filename': 'Broken.mkv', 'filesize': None}]}],
+            }
+        client._make_request = make_request
+
+        results = await client.check_torrents_content([GOOD, BAD.upper()])
+
+        self.assertTrue(results[GOOD]['cached'])
+        self.assertEqual(results[GOOD]['files'], [{'filename': 'Movie.mkv', 'size': 1024, 'id': 1}])
+        self.assertFalse(results[BAD]['cached'])
+        self.assertEqual(results[BAD]['files'], [])
+        self.assertIn('error', results[BAD])
+
+
+class TotalCountTest(unittest.TestCase):
+    def test_header_is_used_when_valid(self):
+        self.assertEqual(RealDebridClient._total_count('2500', [{}] * 1000), 2500)
+
+    def test_missing_or_invalid_header_falls_back_to_page_size(self):
+        page = [{}] * 1000
+        self.assertEqual(RealDebridClient._total_count(None, page), 1000)
+        self.assertEqual(RealDebridClient._total_count('many', page), 1000)
+        self.assertEqual(RealDebridClient._total_count(None, {'success': True}), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()